@@ -29,7 +29,7 @@ bl_info = {
 }
 
 
-if "bpy" in locals():
+if "toolbox" in locals():
     import importlib
     importlib.reload(operators)
     importlib.reload(preferences)
@@ -51,11 +51,9 @@ else:
     from .modules.poliigon_core import env  # noqa: F401, needed for package import testing.
     from .modules.poliigon_core import updater  # noqa: F401, needed for package import testing.
 
-import bpy
-
 
 def register():
-    bver = ".".join([str(x) for x in bpy.app.version])
+    bver = toolbox.get_software_version_str()
     aver = ".".join([str(x) for x in bl_info["version"]])
 
     props.register()
@@ -22,6 +22,7 @@ from datetime import datetime
 from enum import Enum
 from functools import lru_cache
 from typing import Dict, List, Optional, Sequence
+import concurrent.futures
 import functools
 import os
 import time
@@ -465,8 +466,14 @@ class PoliigonAddon():
             self.schedule_downloads(tpe, dl_list, download_dir)
 
             self.print_debug("download_asset_thread POLL LOOP", dbg=dbg)
+            futures = [download.fut for download in dl_list]
             while not all_done and not user_cancel:
-                time.sleep(DOWNLOAD_POLL_INTERVAL)
+                # Wakes up early, as soon as all files are done or one failed,
+                # otherwise after the poll interval to update progress.
+                concurrent.futures.wait(
+                    futures,
+                    timeout=DOWNLOAD_POLL_INTERVAL,
+                    return_when=concurrent.futures.FIRST_EXCEPTION)
                 all_done, any_error, size_downloaded = self.check_downloads(dl_list)
 
                 # Get user cancel and update progress UI
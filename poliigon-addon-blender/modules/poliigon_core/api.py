@@ -38,6 +38,9 @@ from .env import PoliigonEnvironment
 TIMEOUT = 20  # Request timeout in seconds.
 MAX_DL_THREADS = 6
 MIN_VIEW_SCREEN_INTERVAL = 2.0  # seconds min between screen report calls.
+MAX_POOLED_CONNECTIONS = 16  # Per host, kept alive for reuse by _session.
+# Bytes read from a download stream and written to disk per loop iteration.
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
 # Enum values to reference
 ERR_NOT_AUTHORIZED = "Not authorized"
@@ -203,6 +206,9 @@ class PoliigonConnector():
 
     _mp_relevant: bool  # mp information in message meta data
 
+    # Shared by all non-streamed requests, to reuse connections (TLS).
+    _session: requests.Session
+
     # Injected, called when the API login token is invalidated.
     # args (ApiEvent)
     _on_invalidated: callable = None
@@ -226,6 +232,12 @@ class PoliigonConnector():
         self._status_listener = status_listener
         self._mp_relevant = mp_relevant
 
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_maxsize=MAX_POOLED_CONNECTIONS)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
         # TODO(SOFT-728): Revert override once API is updated.
         self._platform = "addon"
         # Update platform to be one of the hard coded API allowable types.
@@ -303,16 +315,16 @@ class PoliigonConnector():
                 payload = self._update_meta_payload(payload)
                 # TODO: Use injected logger when available through core.
                 # print(f"Request payload to {url}: {payload}")
-                res = requests.post(url,
-                                    data=json.dumps(payload),
-                                    headers=headers,
-                                    proxies=proxies,
-                                    timeout=TIMEOUT)
+                res = self._session.post(url,
+                                         data=json.dumps(payload),
+                                         headers=headers,
+                                         proxies=proxies,
+                                         timeout=TIMEOUT)
             elif method == "GET":
-                res = requests.get(url,
-                                   headers=headers,
-                                   proxies=proxies,
-                                   timeout=TIMEOUT)
+                res = self._session.get(url,
+                                        headers=headers,
+                                        proxies=proxies,
+                                        timeout=TIMEOUT)
             else:
                 raise ValueError("raw_request input must be GET, POST, or PUT")
         except requests.exceptions.ConnectionError as e:
@@ -828,8 +840,10 @@ class PoliigonConnector():
             callback: Fn with args (asset_id, file_size) to drive progress bar.
             unzip: Automatically perform unzipping.
 
-        Response: ApiResponse where the body is a dict including the key:
+        Response: ApiResponse where the body is a dict including the keys:
             "file": Path(!) of the downloaded file.
+            "files": Paths of all files in the unzipped archive,
+                     only present if unzip is True.
 
         NOTE: The return value of callback has to be evaluated under all
               circumstances, otherwise cancel requests may get lost.
@@ -877,7 +891,8 @@ class PoliigonConnector():
         try:
             with open(dst_file, "wb") as write_file:
                 last_callback = time.time()
-                for chunk in stream.iter_content(chunk_size=512):
+                for chunk in stream.iter_content(
+                        chunk_size=DOWNLOAD_CHUNK_SIZE):
                     if not chunk:
                         continue
                     write_file.write(chunk)
@@ -931,15 +946,21 @@ class PoliigonConnector():
         if not os.path.exists(asset_dir):
             os.makedirs(asset_dir)
 
+        body = {"file": dst_file}
         if unzip:
             unzip_res = self._unzip_asset(dst_file, asset_dir)
             if not unzip_res.ok:
                 return unzip_res
+            body["files"] = unzip_res.body["files"]
 
-        return ApiResponse({"file": dst_file}, True, None)
+        return ApiResponse(body, True, None)
 
     def _unzip_asset(self, dst_file, asset_dir):
-        """Unzips a archive to specified location."""
+        """Unzips a archive to specified location.
+
+        On success the body's "files" key lists the paths of all files in the
+        archive, including those which already existed and were kept.
+        """
         try:
             with zipfile.ZipFile(dst_file, "r") as read_file:
                 zip_files = read_file.namelist()
@@ -966,7 +987,10 @@ class PoliigonConnector():
                 {"error": e},
                 False,
                 ERR_UNZIP_ERROR)
-        return ApiResponse("Unzip success", True, None)
+        # Member names always use "/", entries ending in one are folders.
+        files = [asset_dir + "/" + file
+                 for file in zip_files if not file.endswith("/")]
+        return ApiResponse({"files": files}, True, None)
 
     def download_asset_get_urls(self,
                                 asset_id: int,
@@ -1104,7 +1128,8 @@ class PoliigonConnector():
 
         try:
             with open(download.get_path(temp=True), "wb") as write_file:
-                for chunk in stream.iter_content(chunk_size=1024):
+                for chunk in stream.iter_content(
+                        chunk_size=DOWNLOAD_CHUNK_SIZE):
                     if chunk is None:
                         continue
                     download.size_downloaded += len(chunk)
@@ -16,13 +16,9 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
+import configparser
 import os
 
-try:
-    import ConfigParser
-except Exception:
-    import configparser as ConfigParser
-
 
 class PoliigonSettings():
     """Settings used for the addon."""
@@ -32,7 +28,7 @@ class PoliigonSettings():
     software_source: str  # e.g. blender
     settings_filename: str
 
-    config: ConfigParser.ConfigParser = None
+    config: configparser.RawConfigParser = None
 
     def __init__(self,
                  addon_name: str,
@@ -93,7 +89,8 @@ class PoliigonSettings():
 
     def get_settings(self):
         # https://docs.python.org/3/library/configparser.html#configparser.ConfigParser.optionxform
-        self.config = ConfigParser.ConfigParser()
+        # No interpolation, stored values like paths may contain "%".
+        self.config = configparser.RawConfigParser()
         self.config.optionxform = str
 
         self._populate_default_settings()
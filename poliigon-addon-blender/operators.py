@@ -68,7 +68,7 @@ class POLIIGON_OT_setting(Operator):
     def execute(self, context):
         global cTB
 
-        cTB.get_ui_scale()  # Force update DPI check for scale.
+        cTB.check_dpi()  # Force update DPI check for scale.
         cTB.print_debug(0, "POLIIGON_OT_setting", self.vMode)
 
         # ...............................................................................
@@ -672,7 +672,7 @@ class POLIIGON_OT_cancel_download(Operator):
     def execute(self, context):
         if self.asset_id == 0:
             return {'CANCELLED'}
-        cTB.vDownloadCancelled.add(self.asset_id)
+        cTB.cancel_download(self.asset_id)
         cTB.print_debug(0, "Cancelled download", self.asset_id)
         self.report({'WARNING'}, "Cancelling download")
         return {'FINISHED'}
@@ -1398,7 +1398,7 @@ class POLIIGON_OT_preview(Operator):
 
             files = [vFile]
             if not os.path.exists(vFile):
-                vURL = cTB.vAssets["poliigon"][self.vType][self.vAsset]["preview"]
+                vURL = vAData["preview"]
                 vTemp = os.path.join(
                     cTB.gOnlinePreviews, self.vAsset + "_quickpreviewX.jpg")
                 self.run_download_backplate(vURL, vTemp, vFile)
@@ -17,27 +17,28 @@
 # ##### END GPL LICENSE BLOCK #####
 
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from functools import lru_cache
+from itertools import chain
 from math import radians
-from typing import Callable, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import atexit
+import configparser
+import copy
 import datetime
+import hashlib
+import io
 import json
 import mathutils
 import os
-import queue
 import re
 import threading
 import time
 import traceback
 
-try:
-    import ConfigParser
-except:
-    import configparser as ConfigParser
-
 from bpy.app.handlers import persistent
 import bpy.utils.previews
 import bmesh
@@ -51,9 +52,376 @@ from .utils import *
 
 MAX_PURCHASE_THREADS = 5
 MAX_DOWNLOAD_THREADS = 5
+MAX_REQUEST_THREADS = 4
+MAX_PREVIEW_THREADS = 8
+MAX_SCAN_THREADS = 4  # Library directories scanned in parallel
+
+# Delay to coalesce bursts of f_SaveSettings calls into a single write.
+SETTINGS_SAVE_DELAY_S = 0.75
+# Delay to coalesce identical download error reports into one sentry message.
+ERROR_REPORT_DELAY_S = 2.0
+
+TEX_EXTS = (".jpg", ".png", ".tif", ".exr")
+PREVIEW_EXTS = (".png", ".jpg", ".jpeg")  # Image previews, unlike e.g. mview.
+MOD_EXTS = (".fbx", ".blend")
+
+MAPS = (
+    "ALPHA",
+    "ALPHAMASKED",
+    "AO",
+    "BUMP",
+    "BUMP16",
+    "COL",
+    "DIFF",
+    "DISP",
+    "DISP16",
+    "EMISSIVE",
+    "FUZZ",
+    "GLOSS",
+    "HDR",
+    "IDMAP",
+    "JPG",
+    "MASK",
+    "METALNESS",
+    "NRM",
+    "NRM16",
+    "REFL",
+    "ROUGHNESS",
+    "SSS",
+    "TRANSMISSION",
+    "OVERLAY",
+)
+SIZES = tuple(f"{i+1}K" for i in range(18)) + ("HIRES",)
+SIZE_ORDER = MappingProxyType({size: idx for idx, size in enumerate(SIZES)})
+HDRI_RESOLUTIONS = ("1K", "2K", "3K", "4K", "6K", "8K", "16K")
+LODS = ("SOURCE",) + tuple(f"LOD{i}" for i in range(5))
+VARS = tuple(f"VAR{i}" for i in range(1, 10))
+# Sets of the above for matching against the parts of a filename.
+MAPS_SET = frozenset(MAPS)
+SIZES_SET = frozenset(SIZES)
+LODS_SET = frozenset(LODS)
+VARS_SET = frozenset(VARS)
+# Endings of lower case filenames (without extension) of local previews.
+PREVIEW_SUFFIXES = ("_atlas", "_sphere", "_cylinder", "_fabric", "_preview1")
+# Texture filenames of local assets contain any map name (anywhere, not only
+# as a "_" separated part) or "Backdrop", matched in a single search.
+LOCAL_TEX_RE = re.compile(
+    "|".join(re.escape(vM) for vM in MAPS + ("Backdrop",)))
+
+# UI icons loaded on register as (icon key, filename, Blender filetype).
+ICONS = (
+    ("ICON_poliigon", "poliigon_logo.png", "IMAGE"),
+    ("ICON_myassets", "my_assets.png", "IMAGE"),
+    ("ICON_new", "poliigon_new.png", "IMAGE"),
+    ("ICON_import", "poliigon_import.png", "IMAGE"),
+    ("ICON_apply", "poliigon_apply.png", "IMAGE"),
+    ("GET_preview", "get_preview.png", "IMAGE"),
+    ("NO_preview", "icon_nopreview.png", "IMAGE"),
+    ("NOTIFY", "poliigon_notify.png", "IMAGE"),
+    ("NEW_RELEASE", "poliigon_new.png", "IMAGE"),
+    ("ICON_cart", "cart_icon.png", "IMAGE"),
+    ("ICON_working", "icon_working.gif", "MOVIE"),
+    ("ICON_dots", "icon_dots.png", "IMAGE"),
+    ("ICON_acquired_check", "acquired_checkmark.png", "IMAGE"),
+    ("ICON_subscription_paused", "subscription_paused.png", "IMAGE"),
+)
+
+# Areas of the asset dicts, "imported" is to be removed (TODO(Andreas)).
+ASSET_AREAS = ("poliigon", "my_assets", "imported", "local")
+CATEGORY_AREAS = ("poliigon", "my_assets", "imported", "new")
+
+# Asset name prefixes (lower case) of backplate assets.
+BACKPLATE_PREFIXES = ("backdrop", "backplate")
+
+# Areas searched in order by get_data_for_asset_id/name.
+ASSET_LOOKUP_AREAS = ("poliigon", "my_assets", "local")
+
+# Workflows in order of preference, if an asset offers several.
+WORKFLOW_PRIORITY = ("METALNESS", "REGULAR", "SPECULAR")
+
+# Thumbnails are fetched through the CDN with the same width=300, sharpen=1
+# and q=75 combo as the website, to make use of the same caching.
+PREVIEW_CDN_URL = ("https://poliigon.com/cdn-cgi/image/"
+                   "width={size},sharpen=1,q=75,f=auto/{url}")
+
+# Placeholder shown for each grid cell while assets are being fetched.
+# Shared by all cells, thus read-only.
+DUMMY_ASSET = MappingProxyType({
+    "name": "dummy",
+    "slug": "",
+    "type": "",
+    "files": (),
+    "maps": (),
+    "lods": (),
+    "sizes": (),
+    "vars": (),
+    "date": "",
+    "credits": 0,
+    "categories": (),
+    "preview": "",
+    "thumbnails": (),
+})
+
+# Size token within asset filenames, e.g. "4K" in "Name_COL_4K.jpg".
+SIZE_TOKEN_RE = re.compile(r"_(\d+K)[_\.]")
+
+# Map name tags in texture filenames, toggled by use_bump/disp/16 settings.
+BUMP_MAPS = frozenset(("BUMP", "BUMP16"))
+DISP_MAPS = frozenset(("DISP", "DISP16"))
+MAPS_16BIT = frozenset(("DISP16", "BUMP16", "NRM16"))
+
+# Settings keys storing the active category per area, e.g. category_poliigon.
+CATEGORY_RE = re.compile(r"^category_(.+)$")
+
+# Default values of material properties, used to reset them in the UI.
+PROP_DEFAULTS = MappingProxyType({
+    "Scale": 1.0,
+    "Aspect Ratio": 1.0,
+    "Normal Strength": 1.0,
+    "Mix Texture Value": 0.0,
+    "Mix Noise Value": 1.0,
+    "Noise Scale": 5.0,
+    "Noise Detail": 2.0,
+    "Noise Roughness": 5.0,
+    "Mix Softness": 0.5,
+    "Mix Bias": 5.0,
+})
 
 ERR_LOGIN_TIMEOUT = "Login with website timed out, please try again"
 
+
+def _setting_int(value: str) -> int:
+    """Parses an int setting, accepting legacy True/False values."""
+    if value == "True":
+        return 1
+    elif value == "False":
+        return 0
+    return int(value)
+
+
+def _setting_bool(value: str) -> bool:
+    """Parses a bool setting the same way configparser's getboolean() does."""
+    try:
+        return configparser.RawConfigParser.BOOLEAN_STATES[value.lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value}")
+
+
+@lru_cache(maxsize=4096)
+def _prettify_category_segment(segment: str) -> str:
+    """Turns a category path segment like "wood-floor" into "Wood Floor"."""
+    return " ".join([word.capitalize() for word in segment.split("-")])
+
+
+def _has_input(node, name: str) -> bool:
+    """Returns whether node has an input socket named name."""
+    return any(vI.name == name for vI in node.inputs)
+
+
+@lru_cache(maxsize=64)
+def _category_slug(category: Tuple[str, ...]) -> str:
+    """Returns the slug format of a category path, e.g.
+
+    from ("All Models", ) to "/"
+    from ("Models", "Bathroom") to "/models/bathroom"
+    and undo transforms of f_GetCategoryChildren.
+    """
+    # TODO: Refactor f_GetCategoryChildren as part of Core migration.
+    slug = "/" + "/".join(
+        [cat.lower().replace(" ", "-") for cat in category]
+    )
+    if slug.startswith("/hdris/"):
+        slug = slug.replace("/hdris/", "/hdrs/")
+    elif slug == "/all-assets":
+        slug = "/"
+    return slug
+
+
+@lru_cache(maxsize=8)
+def _parse_local_time(value: str) -> datetime.datetime:
+    """Parses a "%Y-%m-%d %H:%M:%S" time string as stored in the settings."""
+    # Same result as strptime with above format, but parsed in C.
+    return datetime.datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=16)
+def _date_only(value: Optional[str]) -> Optional[str]:
+    """Extracts "2022-08-19" from "2022-08-19 23:58:37", passing on None."""
+    if not value:
+        return value
+    return value.split(" ", 1)[0]
+
+
+def _split_clean(value: str, sep: str) -> List[str]:
+    """Splits value by sep, dropping any empty parts."""
+    return [part for part in value.split(sep) if part]
+
+
+def _setting_list(value: str) -> List[str]:
+    """Parses a semicolon separated list setting."""
+    return _split_clean(value, ";")
+
+
+def _setting_any(value: str):
+    """Fallback for settings without a known type, tries int, then float."""
+    if value == "True":
+        return 1
+    elif value == "False":
+        return 0
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+# Coercion of the string values in the settings section of the ini file,
+# keys not listed here are parsed via _setting_any().
+SETTING_TYPES = {
+    "add_dirs": _setting_list,
+    "area": str,
+    "auto_download": _setting_int,
+    "brush": str,
+    "conform": _setting_int,
+    "default_lod": str,
+    "del_zip": _setting_int,
+    "disabled_dirs": _setting_list,
+    "download_link_blend": _setting_int,
+    "download_lods": _setting_int,
+    "download_prefer_blend": _setting_int,
+    "first_enabled_time": str,
+    "first_local_asset": float,
+    "hdri": str,
+    "hdri_use_jpg_bg": _setting_bool,
+    "hdrib": str,
+    "hdrif": str,
+    "hide_labels": _setting_int,
+    "hide_scene": _setting_int,
+    "hide_suggest": _setting_int,
+    "last_nps_ask": float,
+    "last_nps_open": float,
+    "last_update": str,
+    "library": str,
+    "location": str,
+    "lod": str,
+    "mapping_type": str,
+    "mat_props": _setting_list,
+    "mat_props_edit": _setting_int,
+    "mix_props": _setting_list,
+    "mres": str,
+    "new_release": str,
+    "new_top": _setting_int,
+    "notify": _setting_int,
+    "page": _setting_int,
+    "preview_size": _setting_int,
+    "previews": _setting_int,
+    "res": str,
+    "set_library": str,
+    "show_active": _setting_int,
+    "show_add_dir": _setting_int,
+    "show_asset_info": _setting_int,
+    "show_credits": _setting_int,
+    "show_default_prefs": _setting_int,
+    "show_display_prefs": _setting_int,
+    "show_feedback": _setting_int,
+    "show_import_prefs": _setting_int,
+    "show_mat_ops": _setting_int,
+    "show_mat_props": _setting_int,
+    "show_mat_texs": _setting_int,
+    "show_mix_props": _setting_int,
+    "show_pass": _setting_int,
+    "show_plan": _setting_int,
+    "show_settings": _setting_int,
+    "show_updater_prefs": _setting_int,
+    "show_user": _setting_int,
+    "sorting": str,
+    "thumbsize": str,
+    "unzip": _setting_int,
+    "update_sel": _setting_int,
+    "use_16": _setting_int,
+    "use_ao": _setting_int,
+    "use_bump": _setting_int,
+    "use_disp": _setting_int,
+    "use_subdiv": _setting_int,
+    "version": str,
+    "win_scale": float,
+}
+
+# Settings used unless overridden by the ini file. Version and maps are
+# filled in by f_GetSettings().
+DEFAULT_SETTINGS = MappingProxyType({
+    "add_dirs": [],
+    "area": "poliigon",
+    "auto_download": 1,
+    "category": {
+        "imported": ["All Assets"],
+        "my_assets": ["All Assets"],
+        "poliigon": ["All Assets"],
+    },
+    "conform": 0,
+    "default_lod": "LOD1",
+    "del_zip": 1,
+    "disabled_dirs": [],
+    "download_lods": 1,
+    "download_prefer_blend": 1,
+    "download_link_blend": 0,
+    "hdri_use_jpg_bg": False,
+    "hide_labels": 1,
+    "hide_scene": 0,
+    "hide_suggest": 0,
+    "library": "",
+    "location": "Properties",
+    "mapping_type": "UV + UberMapping",
+    "mat_props": [],
+    "mix_props": [],
+    "new_release": "",
+    "last_update": "",
+    "new_top": 1,
+    "notify": 5,
+    "page": 10,
+    "preview_size": 7,  # 7 currently constant/hard coded
+    "previews": 1,
+    "set_library": "",
+    "show_active": 1,
+    "show_add_dir": 1,
+    "show_asset_info": 1,
+    "show_credits": 1,
+    "show_default_prefs": 1,
+    "show_display_prefs": 1,
+    "show_import_prefs": 1,
+    "show_mat_ops": 0,
+    "show_mat_props": 0,
+    "show_mat_texs": 0,
+    "show_mix_props": 1,
+    "show_pass": 0,
+    "show_plan": 1,
+    "show_feedback": 0,
+    "show_settings": 0,
+    "show_user": 0,
+    "sorting": "Latest",
+    "thumbsize": "Medium",
+    "unzip": 1,
+    "update_sel": 1,
+    "use_16": 1,
+    "use_ao": 1,
+    "use_bump": 1,
+    "use_disp": 1,
+    "use_subdiv": 1,
+    "version": "",
+    "win_scale": 1,
+    "first_enabled_time": "",
+    "res": "2K",
+    "lod": "NONE",
+    "mres": "2K",
+    "hdri": "1K",
+    "hdrib": "8K",
+    "hdrif": "EXR",  # TODO(Andreas): constant and used in commented code, only
+    "brush": "2K",
+})
+
 # ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
 
 
@@ -90,9 +458,13 @@ class LoginStates(Enum):
     WAIT_FOR_LOGIN = 2
 
 
-@dataclass
+@dataclass(frozen=True)
 class Notification:
-    """Container object for a user notification."""
+    """Container object for a user notification.
+
+    Instances are immutable (and thereby hashable), build a new notice
+    instead of altering a registered one.
+    """
     class ActionType(Enum):
         OPEN_URL = 1
         UPDATE_READY = 2
@@ -140,13 +512,25 @@ class DisplayError:
     asset_name: str  # Optional value, if specific to a single asset.
 
 
+@lru_cache(maxsize=1)
+def get_software_version_str() -> str:
+    """Returns the Blender version like "3.6.2", constant within a session."""
+    return ".".join([str(x) for x in bpy.app.version])
+
+
+@lru_cache(maxsize=8)
+def format_version(version: tuple) -> str:
+    """Returns a version tuple like (1, 3, 2) as string like "v1.3.2"."""
+    return updater.t2v([str(x) for x in version])
+
+
 def build_update_notification():
     """Construct the a update notification if available."""
     if not cTB.updater.update_ready:
         return
 
     this_update = cTB.updater.update_data
-    vstring = updater.t2v([str(x) for x in this_update.version])
+    vstring = format_version(tuple(this_update.version))
     logs = "https://poliigon.com/blender"
 
     update_notice = Notification(
@@ -226,15 +610,72 @@ class c_Toolbox:
 
     # Icon containers.
     vIcons = None
-    vPreviews = None
+    _previews = None  # Asset thumbnails, created on first use of vPreviews.
+
+    # Hash of the settings file content last read or written.
+    settings_hash = None
+    # Modification time (ns) of the settings file matching the parsed config,
+    # None if the parsed config needs to be (re-)read from disk.
+    _config_mtime = None
+    # Pending deferred write of the settings file, see f_SaveSettings.
+    _save_timer = None
+    # Settings copied by the latest f_SaveSettings, for the pending write.
+    _save_snapshot = None
+    # Pending send of coalesced error reports, see _queue_error_report.
+    _error_report_timer = None
+
+    # Non-color colorspace name accepted last, see
+    # _try_to_assign_non_color_space.
+    _non_color_space_name = None
 
     # Container for threads.
     # Initialized here so it can be referenced before register completes.
     vThreads = []
 
+    # Settings and user data, round-tripped via the settings ini file.
+    # These stay plain dicts, as the ini may carry keys unknown to this
+    # version of the addon, which still need to be preserved on save.
+    vSettings: Dict[str, Any]
+    vUser: Dict[str, Any]
+
+    # Per area UI state, keyed by "poliigon", "my_assets" or "imported".
+    vSearch: Dict[str, str]
+    vLastSearch: Dict[str, str]
+    vPage: Dict[str, int]
+    vPages: Dict[str, int]
+
+    # Results of f_GetAssetsSorted for local areas,
+    # {(area, category, search, page size, version): (assets, page count)}
+    _sorted_assets_cache = {}
+    _sorted_assets_cache_version = 0
+    _local_assets_version = 0  # Bumped by _local_assets_changed()
+
+    # {folder path: scan} of the last library scan, None until loaded from
+    # disk, see _scan_local_folders().
+    _local_folders = None
+
+    # Locations of assets in vAssets, see _rebuild_asset_locations().
+    _asset_locations_by_id = {}  # {asset id: (type, name)}
+    _asset_types_by_name = {}  # {asset name: type}
+
+    # Thread pools for purchases, downloads, thumbnail previews and
+    # small API requests, created on register.
+    purchase_pool = None
+    download_pool = None
+    preview_pool = None
+    request_pool = None
+    _download_futures = {}  # Replaced on register
+
     # Static strings referenced elsewhere:
     ERR_CREDS_FORMAT = "Invalid email format/password length."
 
+    @property
+    def vPreviews(self):
+        """Asset thumbnail previews, only created once first needed."""
+        if self._previews is None:
+            self._previews = bpy.utils.previews.new()
+        return self._previews
+
     def __init__(self, api_service=None):
         self.env = env.PoliigonEnvironment(
             addon_name="poliigon-addon-blender",
@@ -253,12 +694,23 @@ class c_Toolbox:
         self.subscription_info_received = False
         self.credits_info_received = False
 
+        # Parser of the settings file, reused across reads and writes.
+        # No interpolation, stored paths may contain "%".
+        self._config = configparser.RawConfigParser()
+        self._config.optionxform = str
+        self._config_lock = threading.Lock()
+        self._save_timer_lock = threading.Lock()
+        # {(message, code_msg, level): count} waiting for the report timer.
+        self._pending_error_reports = {}
+        self._error_report_lock = threading.Lock()
+        self._preview_lock = threading.Lock()
+
         self.vTimer = time.time()
 
     def register(self, version: str):
         """Deferred registration, to ensure properties exist."""
         self.version = version
-        software_version = ".".join([str(x) for x in bpy.app.version])
+        software_version = get_software_version_str()
         self._api.register_update(self.version, software_version)
 
         self.updater = updater.SoftwareUpdater(
@@ -273,6 +725,9 @@ class c_Toolbox:
         # Output used to recognize a fresh install (or update).
         any_updated = self.update_files(self.gScriptDir)
 
+        # NOTE: Paths are kept as strings with forward slashes on purpose,
+        #       they get compared against and concatenated with the
+        #       "/"-joined library paths used throughout the addon.
         # TODO(SOFT-58): Defer folder creation and prompt for user path.
         base_dir = os.path.join(
             os.path.expanduser("~").replace("\\", "/"),
@@ -319,53 +774,21 @@ class c_Toolbox:
             self.vIcons = bpy.utils.previews.new()
         else:
             self.vIcons.clear()
-        self.vIcons.load("ICON_poliigon",
-                         os.path.join(self.gScriptDir, "poliigon_logo.png"),
-                         "IMAGE")
-        self.vIcons.load("ICON_myassets",
-                         os.path.join(self.gScriptDir, "my_assets.png"),
-                         "IMAGE")
-        self.vIcons.load("ICON_new",
-                         os.path.join(self.gScriptDir, "poliigon_new.png"),
-                         "IMAGE")
-        self.vIcons.load("ICON_import",
-                         os.path.join(self.gScriptDir, "poliigon_import.png"),
-                         "IMAGE")
-        self.vIcons.load("ICON_apply",
-                         os.path.join(self.gScriptDir, "poliigon_apply.png"),
-                         "IMAGE")
-        self.vIcons.load("GET_preview",
-                         os.path.join(self.gScriptDir, "get_preview.png"),
-                         "IMAGE")
-        self.vIcons.load("NO_preview",
-                         os.path.join(self.gScriptDir, "icon_nopreview.png"),
-                         "IMAGE")
-        self.vIcons.load("NOTIFY",
-                         os.path.join(self.gScriptDir, "poliigon_notify.png"),
-                         "IMAGE")
-        self.vIcons.load("NEW_RELEASE",
-                         os.path.join(self.gScriptDir, "poliigon_new.png"),
-                         "IMAGE")
-        self.vIcons.load("ICON_cart",
-                         os.path.join(self.gScriptDir, "cart_icon.png"),
-                         "IMAGE")
-        self.vIcons.load("ICON_working",
-                         os.path.join(self.gScriptDir, "icon_working.gif"),
-                         "MOVIE")
-        self.vIcons.load("ICON_dots",
-                         os.path.join(self.gScriptDir, "icon_dots.png"),
-                         "IMAGE")
-        self.vIcons.load("ICON_acquired_check",
-                         os.path.join(self.gScriptDir, "acquired_checkmark.png"),
-                         "IMAGE")
-        self.vIcons.load("ICON_subscription_paused",
-                         os.path.join(self.gScriptDir, "subscription_paused.png"),
-                         "IMAGE")
-
-        if self.vPreviews is None:
-            self.vPreviews = bpy.utils.previews.new()
-        else:
-            self.vPreviews.clear()
+
+        # One directory scan instead of a stat per icon file.
+        icon_files = self._scan_files(self.gScriptDir)
+
+        def icon_path(filename):
+            # Fall back to the plain path, e.g. if the scan failed.
+            return icon_files.get(
+                filename, os.path.join(self.gScriptDir, filename))
+
+        for icon_key, filename, filetype in ICONS:
+            self.vIcons.load(icon_key, icon_path(filename), filetype)
+
+        # Asset previews get created lazily via the vPreviews property.
+        if self._previews is not None:
+            self._previews.clear()
 
         # ......................................................................................
 
@@ -427,39 +850,15 @@ class c_Toolbox:
         self.vPrevScale = 1.0
         self.vMatSlot = 0
 
-        self.vTexExts = [".jpg", ".png", ".tif", ".exr"]
-        self.vModExts = [".fbx", ".blend"]
-
-        self.vMaps = [
-            "ALPHA",
-            "ALPHAMASKED",
-            "AO",
-            "BUMP",
-            "BUMP16",
-            "COL",
-            "DIFF",
-            "DISP",
-            "DISP16",
-            "EMISSIVE",
-            "FUZZ",
-            "GLOSS",
-            "HDR",
-            "IDMAP",
-            "JPG",
-            "MASK",
-            "METALNESS",
-            "NRM",
-            "NRM16",
-            "REFL",
-            "ROUGHNESS",
-            "SSS",
-            "TRANSMISSION",
-            "OVERLAY",
-        ]
-        self.vSizes = [f'{i+1}K' for i in range(18)] + ["HIRES"]
-        self.HDRI_RESOLUTIONS = ["1K", "2K", "3K", "4K", "6K", "8K", "16K"]
-        self.vLODs = ['SOURCE'] + [f'LOD{i}' for i in range(5)]
-        self.vVars = [f'VAR{i}' for i in range(1, 10)]
+        # Invariant lookup data, shared by reference with module constants.
+        self.vTexExts = TEX_EXTS
+        self.vModExts = MOD_EXTS
+
+        self.vMaps = MAPS
+        self.vSizes = SIZES
+        self.HDRI_RESOLUTIONS = HDRI_RESOLUTIONS
+        self.vLODs = LODS
+        self.vVars = VARS
 
         self.vModSecondaries = ["Footrest", "Vase"]
 
@@ -493,38 +892,27 @@ class c_Toolbox:
 
         # .....................................................................
 
-        self.vCategories = {}
-        self.vCategories["poliigon"] = {}
-        self.vCategories["my_assets"] = {}
-        self.vCategories["imported"] = {}
-        self.vCategories["new"] = {}
+        self.vCategories = {area: {} for area in CATEGORY_AREAS}
 
         self.vAssetTypes = ["Textures", "Models", "HDRIs", "Brushes"]
 
-        self.vAssets = {}
-        self.vAssets["poliigon"] = {}
-        self.vAssets["my_assets"] = {}
-        self.vAssets["imported"] = {}  # TODO(Andreas): to be removed
-        self.vAssets["local"] = {}
+        # Ensure the base keys always exist:
+        self.vAssets = {area: {key: {} for key in self.vAssetTypes}
+                        for area in ASSET_AREAS}
 
         # Populated in f_GetSceneAssets,
         # contains references to Blender entities.
         # { type : {asset_name : [objs, mats,...] } }
         self.imported_assets = {}
+        # Names of imported_assets with their lower case version for search,
+        # { type : [(asset_name_lower, asset_name), ...] }
+        self.imported_names_lc = {}
+        self._local_assets_changed()
 
-        # Ensure the base keys always exist:
-        for key in self.vAssetTypes:
-            self.vAssets["poliigon"][key] = {}
-            self.vAssets["my_assets"][key] = {}
-            self.vAssets["imported"][key] = {}
-            self.vAssets["local"][key] = {}
-
-        self.vAssetsIndex = {}
-        self.vAssetsIndex["poliigon"] = {}
-        self.vAssetsIndex["my_assets"] = {}
-        self.vAssetsIndex["imported"] = {}
+        self.vAssetsIndex = {area: {} for area in ASSET_AREAS
+                             if area != "local"}
 
-        self.vPurchased = []
+        self.vPurchased = set()  # Names of purchased assets.
 
         # Dictionary storing last download settings per asset.
         # Used in UI drawing to modify Apply/Import button.
@@ -545,19 +933,29 @@ class c_Toolbox:
 
         self.vDownloadQueue = {}
         self.vPurchaseQueue = {}
+        # Only holds ids of queued or running downloads, see queue_download.
         self.vDownloadCancelled = set()
-        self.vPreviewsQueue = []
+        # Futures of downloads submitted to download_pool, by asset id.
+        self._download_futures = {}
         self.vQuickPreviewQueue = {}
 
-        self.vDownloadFailed = {}
-
-        self.purchase_queue = queue.Queue()
-        self.purchase_threads = []
-
-        self.download_queue = queue.Queue()
-        self.download_threads = []
-
-        self.vPreviewsDownloading = []
+        # Bounded pools for purchases and downloads, queueing any excess jobs.
+        self.shutdown_pools()
+        self.purchase_pool = ThreadPoolExecutor(
+            max_workers=MAX_PURCHASE_THREADS,
+            thread_name_prefix="poliigon-purchase")
+        self.download_pool = ThreadPoolExecutor(
+            max_workers=MAX_DOWNLOAD_THREADS,
+            thread_name_prefix="poliigon-download")
+        self.preview_pool = ThreadPoolExecutor(
+            max_workers=MAX_PREVIEW_THREADS,
+            thread_name_prefix="poliigon-preview")
+        # Fire-and-forget event signals and small data requests.
+        self.request_pool = ThreadPoolExecutor(
+            max_workers=MAX_REQUEST_THREADS,
+            thread_name_prefix="poliigon-request")
+
+        self.vPreviewsDownloading = set()
 
         self.vGettingData = 1
         self.vWasWorking = False  # Identify if at last check, was still running.
@@ -569,13 +967,9 @@ class c_Toolbox:
         self.vGettingPages["my_assets"] = []
         self.vGettingPages["imported"] = []
 
-        self.f_GetCredits()
-        self.f_GetUserInfo()
-        self.f_GetSubscriptionDetails()
+        # Remote requests run in the request pool, to not block register.
+        self._bootstrap_remote()
 
-        self.f_GetAssets("my_assets", vMax=5000, vBackground=1)
-        self.f_GetAssets()
-        self.f_GetCategories()
         self.f_GetLocalAssets()
 
         # Note: When being called, the function will set this to None,
@@ -599,17 +993,7 @@ class c_Toolbox:
         self.vActiveMixMat = None
         self.vMixTexture = ""
 
-        self.vPropDefaults = {}
-        self.vPropDefaults["Scale"] = 1.0
-        self.vPropDefaults["Aspect Ratio"] = 1.0
-        self.vPropDefaults["Normal Strength"] = 1.0
-        self.vPropDefaults["Mix Texture Value"] = 0.0
-        self.vPropDefaults["Mix Noise Value"] = 1.0
-        self.vPropDefaults["Noise Scale"] = 5.0
-        self.vPropDefaults["Noise Detail"] = 2.0
-        self.vPropDefaults["Noise Roughness"] = 5.0
-        self.vPropDefaults["Mix Softness"] = 0.5
-        self.vPropDefaults["Mix Bias"] = 5.0
+        self.vPropDefaults = PROP_DEFAULTS
 
         self.vAllMats = None
 
@@ -618,79 +1002,115 @@ class c_Toolbox:
 
     # ...............................................................................................
 
+    @reporting.handle_function(silent=True)
+    def _bootstrap_remote(self):
+        """Submits the initial user and asset requests to the request pool.
+
+        Requests run side by side, so startup waits for the slowest request
+        rather than the sum of all of them.
+        """
+        self._submit_request(self.f_APIGetUserBundle)
+        # Marks the pages as in progress right away, before the requests
+        # get submitted to the pool.
+        self.f_GetAssets("my_assets", vMax=5000, vBackground=1, vUsePool=True)
+        self.f_GetAssets(vUsePool=True)
+        self._submit_request(self.f_APIGetCategories)
+
+    def shutdown_pools(self):
+        """Shuts down the thread pools, dropping queued jobs.
+
+        Jobs already running will finish, but check vRunning to exit early.
+        """
+        # Also cancels pending downloads on Python < 3.9, see below.
+        for fut in list(self._download_futures.values()):
+            fut.cancel()
+        for pool in (self.purchase_pool,
+                     self.download_pool,
+                     self.preview_pool,
+                     self.request_pool):
+            if pool is None:
+                continue
+            try:
+                pool.shutdown(wait=False, cancel_futures=True)
+            except TypeError:
+                # cancel_futures is only available from Python 3.9 on.
+                pool.shutdown(wait=False)
+        self.purchase_pool = None
+        self.download_pool = None
+        self.preview_pool = None
+        self.request_pool = None
+
+    def _scan_files(self, path: str) -> Dict[str, str]:
+        """Returns a {filename: filepath} dict of all files within path."""
+        try:
+            with os.scandir(path) as entries:
+                return {entry.name: entry.path
+                        for entry in entries if entry.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
+            return {}
+
+    def _iter_files_recursive(self, path: str):
+        """Yields the paths of all files within path and its subfolders.
+
+        Paths are joined with "/" like os.walk(path) + "/" + file would.
+        """
+        for current, entries in self._walk_files(path):
+            for entry in entries:
+                if entry.is_file():
+                    yield current + "/" + entry.name
+
+    def _walk_files(self, path: str):
+        """Yields (folder, file DirEntries) for path and all its subfolders.
+
+        Like os.walk() without following symlinked folders, but the entries
+        are returned for use of their cached is_*() and stat() results.
+        Folder paths are joined with "/".
+        """
+        dirs = [path]
+        while dirs:
+            current = dirs.pop()
+            try:
+                files, subdirs = self._list_dir(current)
+            except OSError:
+                continue  # Like os.walk, skip folders which can't be read.
+            dirs.extend(subdirs)
+            yield current, files
+
+    def _list_dir(self, path: str):
+        """Returns (file DirEntries, subfolder paths) of a single folder.
+
+        Symlinked folders are not returned as subfolders, like with os.walk.
+        Raises OSError, if the folder can't be read.
+        """
+        # NOTE: While os.path.join() is tempting here,
+        #       all over P4B "a" + "/" + "b" is used.
+        #       On Win join() will introduce a backslash,
+        #       which then leads to paths no longer matching their
+        #       "all slash" counter parts, potentially causing double
+        #       imports.
+        # TODO(Andreas): Rework path handling to make use of
+        #                os.path.normpath() and os.path.join().
+        files = []
+        subdirs = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    files.append(entry)
+                elif not entry.is_symlink():
+                    subdirs.append(path + "/" + entry.name)
+        return files, subdirs
+
     def f_GetSettings(self):
         dbg = 0
         self.print_separator(dbg, "f_GetSettings")
 
-        self.vSettings = {}
-        self.vSettings["add_dirs"] = []
-        self.vSettings["area"] = "poliigon"
-        self.vSettings["auto_download"] = 1
-        self.vSettings["category"] = {}
-        self.vSettings["category"]["imported"] = ["All Assets"]
-        self.vSettings["category"]["my_assets"] = ["All Assets"]
-        self.vSettings["category"]["poliigon"] = ["All Assets"]
-        self.vSettings["conform"] = 0
-        self.vSettings["default_lod"] = "LOD1"
-        self.vSettings["del_zip"] = 1
-        self.vSettings["disabled_dirs"] = []
-        self.vSettings["download_lods"] = 1
-        self.vSettings["download_prefer_blend"] = 1
-        self.vSettings["download_link_blend"] = 0
-        self.vSettings["hdri_use_jpg_bg"] = False
-        self.vSettings["hide_labels"] = 1
-        self.vSettings["hide_scene"] = 0
-        self.vSettings["hide_suggest"] = 0
-        self.vSettings["library"] = ""
-        self.vSettings["location"] = "Properties"
-        self.vSettings["mapping_type"] = "UV + UberMapping"
-        self.vSettings["mat_props"] = []
-        self.vSettings["mix_props"] = []
-        self.vSettings["new_release"] = ""
-        self.vSettings["last_update"] = ""
-        self.vSettings["new_top"] = 1
-        self.vSettings["notify"] = 5
-        self.vSettings["page"] = 10
-        self.vSettings["preview_size"] = 7  # 7 currently constant/hard coded
-        self.vSettings["previews"] = 1
-        self.vSettings["set_library"] = ""
-        self.vSettings["show_active"] = 1
-        self.vSettings["show_add_dir"] = 1
-        self.vSettings["show_asset_info"] = 1
-        self.vSettings["show_credits"] = 1
-        self.vSettings["show_default_prefs"] = 1
-        self.vSettings["show_display_prefs"] = 1
-        self.vSettings["show_import_prefs"] = 1
-        self.vSettings["show_mat_ops"] = 0
-        self.vSettings["show_mat_props"] = 0
-        self.vSettings["show_mat_texs"] = 0
-        self.vSettings["show_mix_props"] = 1
-        self.vSettings["show_pass"] = 0
-        self.vSettings["show_plan"] = 1
-        self.vSettings["show_feedback"] = 0
-        self.vSettings["show_settings"] = 0
-        self.vSettings["show_user"] = 0
-        self.vSettings["sorting"] = "Latest"
-        self.vSettings["thumbsize"] = "Medium"
-        self.vSettings["unzip"] = 1
-        self.vSettings["update_sel"] = 1
-        self.vSettings["use_16"] = 1
-        self.vSettings["use_ao"] = 1
-        self.vSettings["use_bump"] = 1
-        self.vSettings["use_disp"] = 1
-        self.vSettings["use_subdiv"] = 1
+        self.vSettings = copy.deepcopy(dict(DEFAULT_SETTINGS))
         self.vSettings["version"] = self.version
-        self.vSettings["win_scale"] = 1
-        self.vSettings["first_enabled_time"] = ""
-
-        self.vSettings["res"] = "2K"
-        self.vSettings["lod"] = "NONE"
-        self.vSettings["mres"] = "2K"
-        self.vSettings["hdri"] = "1K"
-        self.vSettings["hdrib"] = "8K"
-        self.vSettings["hdrif"] = "EXR"  # TODO(Andreas): constant and used in commented code, only
-        self.vSettings["brush"] = "2K"
-        self.vSettings["maps"] = self.vMaps
+        self.vSettings["maps"] = list(self.vMaps)
 
         # ...............................................................................................
 
@@ -705,105 +1125,88 @@ class c_Toolbox:
 
         # ...............................................................................................
 
-        if f_Ex(self.gSettingsFile):
-            vConfig = self.read_config()
+        with self._config_lock:
+            if f_Ex(self.gSettingsFile):
+                vConfig = self.read_config()
 
-            if vConfig.has_section("user"):
-                for vK in vConfig.options("user"):
-                    if vK in self.skip_legacy_settings:
-                        continue
-                    if vK in ["credits", "credits_od", "plan_credit"]:
-                        try:
-                            self.vUser[vK] = int(vConfig.get("user", vK))
-                        except ValueError:
-                            self.vUser[vK] = 0
-                    elif vK == "is_free_user":
-                        # Don't default to 0 value, default to not set for
-                        # free user, as 0 is treated as an active user and thus
-                        # would not be shown the free query.
-                        try:
-                            self.vUser[vK] = int(vConfig.get("user", vK))
-                        except ValueError:
-                            self.vUser[vK] = None
-                    elif vK == "token":
-                        token = vConfig.get("user", "token")
-                        if token and token != "None":
-                            self._api.token = vConfig.get("user", "token")
-                    else:
-                        self.vUser[vK] = vConfig.get("user", vK)
+                if vConfig.has_section("user"):
+                    for vK in vConfig.options("user"):
+                        if vK in self.skip_legacy_settings:
+                            continue
+                        if vK in ["credits", "credits_od", "plan_credit"]:
+                            try:
+                                self.vUser[vK] = int(vConfig.get("user", vK))
+                            except ValueError:
+                                self.vUser[vK] = 0
+                        elif vK == "is_free_user":
+                            # Don't default to 0 value, default to not set for
+                            # free user, as 0 is treated as an active user and thus
+                            # would not be shown the free query.
+                            try:
+                                self.vUser[vK] = int(vConfig.get("user", vK))
+                            except ValueError:
+                                self.vUser[vK] = None
+                        elif vK == "token":
+                            token = vConfig.get("user", "token")
+                            if token and token != "None":
+                                self._api.token = vConfig.get("user", "token")
+                        else:
+                            self.vUser[vK] = vConfig.get("user", vK)
 
-                if self.vUser["id"]:
-                    reporting.assign_user(self.vUser["id"])
+                    if self.vUser["id"]:
+                        reporting.assign_user(self.vUser["id"])
 
-            else:
-                os.remove(self.gSettingsFile)
-                vConfig = ConfigParser.ConfigParser()
+                else:
+                    os.remove(self.gSettingsFile)
+                    vConfig = self._clear_config()
 
-            if vConfig.has_section("settings"):
-                vVer = None
-                if vConfig.has_option("settings", "version"):
-                    vVer = vConfig.get("settings", "version")
+                if vConfig.has_section("settings"):
+                    vVer = None
+                    if vConfig.has_option("settings", "version"):
+                        vVer = vConfig.get("settings", "version")
 
-                for vS in vConfig.options("settings"):
-                    if vS.startswith("category"):
-                        try:
-                            vArea = vS.replace("category_", "")
-                            self.vSettings["category"][vArea] = vConfig.get(
-                                "settings", vS
-                            ).split("/")
-                            if "" in self.vSettings[vS]:
-                                self.vSettings["category"][vArea].remove("")
-                        except:
-                            pass
-                    else:
-                        self.vSettings[vS] = vConfig.get("settings", vS)
-
-                        if vS in [
-                            "add_dirs",
-                            "disabled_dirs",
-                            "mat_props",
-                            "mix_props",
-                        ]:
-                            self.vSettings[vS] = self.vSettings[vS].split(";")
-                            if "" in self.vSettings[vS]:
-                                self.vSettings[vS].remove("")
-                        elif self.vSettings[vS] == "True":
-                            self.vSettings[vS] = 1
-                        elif self.vSettings[vS] == "False":
-                            self.vSettings[vS] = 0
+                    for vS in vConfig.options("settings"):
+                        match_category = CATEGORY_RE.match(vS)
+                        if match_category:
+                            try:
+                                vArea = match_category.group(1)
+                                self.vSettings["category"][vArea] = _split_clean(
+                                    vConfig.get("settings", vS), "/")
+                            except configparser.Error:
+                                pass
                         else:
+                            vValue = vConfig.get("settings", vS)
+                            coerce = SETTING_TYPES.get(vS, _setting_any)
                             try:
-                                self.vSettings[vS] = int(self.vSettings[vS])
-                            except:
-                                try:
-                                    self.vSettings[vS] = float(self.vSettings[vS])
-                                except:
-                                    pass
+                                self.vSettings[vS] = coerce(vValue)
+                            except ValueError:
+                                # E.g. hand edited file, keep the legacy parsing.
+                                self.vSettings[vS] = _setting_any(vValue)
 
-            if vConfig.has_section("presets"):
-                for vP in vConfig.options("presets"):
-                    try:
-                        self.vPresets[vP] = [
-                            float(vV) for vV in vConfig.get("presets", vP).split(";")
-                        ]
-                    except:
-                        pass
+                if vConfig.has_section("presets"):
+                    for vP in vConfig.options("presets"):
+                        try:
+                            self.vPresets[vP] = [
+                                float(vV) for vV in vConfig.get("presets", vP).split(";")
+                            ]
+                        except:
+                            pass
 
-            if vConfig.has_section("mixpresets"):
-                for vP in vConfig.options("mixpresets"):
-                    try:
-                        self.vMixPresets[vP] = [
-                            float(vV) for vV in vConfig.get("mixpresets", vP).split(";")
-                        ]
-                    except:
-                        pass
+                if vConfig.has_section("mixpresets"):
+                    for vP in vConfig.options("mixpresets"):
+                        try:
+                            self.vMixPresets[vP] = [
+                                float(vV) for vV in vConfig.get("mixpresets", vP).split(";")
+                            ]
+                        except:
+                            pass
 
-            if vConfig.has_section("download"):
-                for vO in vConfig.options("download"):
-                    if vO == "res":
-                        self.vSettings["res"] = vConfig.get("download", vO)
-                    elif vO == "maps":
-                        self.vSettings["maps"] = vConfig.get("download", vO).split(";")
+                if vConfig.has_section("download"):
+                    for vO in vConfig.options("download"):
+                        if vO == "res":
+                            self.vSettings["res"] = vConfig.get("download", vO)
+                        elif vO == "maps":
+                            self.vSettings["maps"] = vConfig.get("download", vO).split(";")
 
         # ...............................................................................................
 
@@ -824,93 +1227,209 @@ class c_Toolbox:
         self.f_SaveSettings()
 
     def read_config(self):
-        """Safely reads the config or returns an empty one if corrupted."""
-        config = ConfigParser.ConfigParser()
-        config.optionxform = str
+        """Safely reads the config or returns an empty one if corrupted.
+
+        The file only gets parsed again, if it changed on disk since it was
+        last read or written by the addon.
+        """
+        # NOTE: The ini format is kept on purpose. The file is shared between
+        #       addon versions (also on downgrade) and tomllib is read-only
+        #       and only part of Python 3.11+, which older Blenders lack.
+        mtime = self._get_settings_mtime()
+        if mtime is not None and mtime == self._config_mtime:
+            return self._config
+
+        config = self._clear_config()
+        self.settings_hash = None
+        self._config_mtime = None
+        try:
+            with open(self.gSettingsFile, "r") as vFile:
+                content = vFile.read()
+        except FileNotFoundError:
+            return config
+        except (OSError, UnicodeDecodeError) as e:
+            print(e)
+            print("Config reading error, using fresh empty config instead.")
+            return config
+
         try:
-            config.read(self.gSettingsFile)
-        except ConfigParser.Error as e:
+            config.read_string(content, source=self.gSettingsFile)
+        except configparser.Error as e:
             # Corrupted file, return empty config.
             print(e)
             print("Config parsing error, using fresh empty config instead.")
-            config = ConfigParser.ConfigParser()
-            config.optionxform = str
+            return self._clear_config()
 
+        self.settings_hash = self._hash_settings(content)
+        self._config_mtime = mtime
         return config
 
+    def _get_settings_mtime(self) -> Optional[int]:
+        """Returns the settings file's modification time or None if missing."""
+        try:
+            return os.stat(self.gSettingsFile).st_mtime_ns
+        except OSError:
+            return None
+
+    def _clear_config(self):
+        """Empties and returns the ConfigParser reused for the settings file.
+
+        Callers need to hold _config_lock while using the returned parser.
+        """
+        for section in self._config.sections():
+            self._config.remove_section(section)
+        return self._config
+
+    def _hash_settings(self, content: str) -> str:
+        """Returns a hash of the settings file content."""
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def _write_settings(self, content: str) -> None:
+        """Writes the settings file atomically, if its content changed."""
+        content_hash = self._hash_settings(content)
+        if content_hash == self.settings_hash:
+            return
+
+        # Until written, the parsed config is ahead of the file on disk.
+        self._config_mtime = None
+        f_MDir(self.gSettingsDir)
+
+        write_file_atomic(self.gSettingsFile, content)
+        self.settings_hash = content_hash
+        self._config_mtime = self._get_settings_mtime()
+
     def f_SaveSettings(self):
+        """Schedules writing the settings file.
+
+        Saves requested in quick succession get coalesced into one write,
+        which stores the values of the latest request. The values get copied
+        here on the calling thread, the timer thread only writes the copy.
+        Use flush_settings_now() where the file needs to be written at once.
+        """
+        vSnapshot = self._snapshot_settings()
+        with self._save_timer_lock:
+            self._save_snapshot = vSnapshot
+            if self._save_timer is not None:
+                return  # Pending write will pick up the latest snapshot.
+            self._save_timer = threading.Timer(
+                SETTINGS_SAVE_DELAY_S, self._flush_settings_thread)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    @reporting.handle_function(silent=True)
+    def _flush_settings_thread(self):
+        """Timer thread writing the settings scheduled by f_SaveSettings."""
+        with self._save_timer_lock:
+            vSnapshot = self._save_snapshot
+            self._save_snapshot = None
+            self._save_timer = None
+        if vSnapshot is None:
+            return  # Already written by flush_settings_now()
+        self._save_settings(vSnapshot)
+
+    def flush_settings_now(self):
+        """Cancels any pending deferred save and writes the settings now."""
+        with self._save_timer_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            self._save_snapshot = None
+        self._save_settings(self._snapshot_settings())
+
+    def _snapshot_settings(self) -> Dict:
+        """Returns copies of the settings to be written by _save_settings."""
+        vSettings = {}
+        for vS, vValue in self.vSettings.items():
+            if vS == "category":
+                vValue = {vA: list(vCat) for vA, vCat in vValue.items()}
+            elif isinstance(vValue, (list, dict)):
+                vValue = vValue.copy()
+            vSettings[vS] = vValue
+
+        return {
+            "user": dict(self.vUser),
+            "settings": vSettings,
+            "presets": {vP: list(vV) for vP, vV in self.vPresets.items()},
+            "mixpresets": {
+                vP: list(vV) for vP, vV in self.vMixPresets.items()},
+        }
+
+    def _save_settings(self, vSnapshot: Dict):
         dbg = 0
         self.print_separator(dbg, "f_SaveSettings")
-        vConfig = self.read_config()
-
-        # ................................................
+        vUser = vSnapshot["user"]
+        vSettings = vSnapshot["settings"]
+        vPresets = vSnapshot["presets"]
+        vMixPresets = vSnapshot["mixpresets"]
+        with self._config_lock:
+            vConfig = self.read_config()
 
-        if not vConfig.has_section("user"):
-            vConfig.add_section("user")
+            # ................................................
 
-        for vK in self.vUser.keys():
-            if vK in self.skip_legacy_settings:
-                vConfig.remove_option("user", vK)
-                continue
-            vConfig.set("user", vK, str(self.vUser[vK]))
+            if not vConfig.has_section("user"):
+                vConfig.add_section("user")
 
-        # Save token as if cTB field, on load will be parsed to _api.token
-        vConfig.set("user", "token", str(self._api.token))
+            for vK in vUser.keys():
+                if vK in self.skip_legacy_settings:
+                    vConfig.remove_option("user", vK)
+                    continue
+                vConfig.set("user", vK, str(vUser[vK]))
 
-        # ................................................
+            # Save token as if cTB field, on load will be parsed to _api.token
+            vConfig.set("user", "token", str(self._api.token))
 
-        if not vConfig.has_section("settings"):
-            vConfig.add_section("settings")
+            # ................................................
 
-        for vS in self.vSettings.keys():
-            if vS == "category":
-                for vA in self.vSettings[vS].keys():
-                    vConfig.set(
-                        "settings", vS + "_" + vA, "/".join(self.vSettings[vS][vA])
-                    )
+            if not vConfig.has_section("settings"):
+                vConfig.add_section("settings")
 
-            elif vS in ["add_dirs", "disabled_dirs", "mat_props", "mix_props"]:
-                vConfig.set("settings", vS, ";".join(self.vSettings[vS]))
+            for vS in vSettings.keys():
+                if vS == "category":
+                    for vA in vSettings[vS].keys():
+                        vConfig.set(
+                            "settings", vS + "_" + vA, "/".join(vSettings[vS][vA])
+                        )
 
-            else:
-                vConfig.set("settings", vS, str(self.vSettings[vS]))
+                elif vS in ["add_dirs", "disabled_dirs", "mat_props", "mix_props"]:
+                    vConfig.set("settings", vS, ";".join(vSettings[vS]))
 
-        # ................................................
+                else:
+                    vConfig.set("settings", vS, str(vSettings[vS]))
 
-        if not vConfig.has_section("presets"):
-            vConfig.add_section("presets")
+            # ................................................
 
-        for vP in self.vPresets.keys():
-            vConfig.set("presets", vP, ";".join([str(vV) for vV in self.vPresets[vP]]))
+            if not vConfig.has_section("presets"):
+                vConfig.add_section("presets")
 
-        # ................................................
+            for vP in vPresets.keys():
+                vConfig.set("presets", vP, ";".join([str(vV) for vV in vPresets[vP]]))
 
-        if not vConfig.has_section("mixpresets"):
-            vConfig.add_section("mixpresets")
+            # ................................................
 
-        for vP in self.vMixPresets.keys():
-            vConfig.set(
-                "mixpresets", vP, ";".join([str(vV) for vV in self.vMixPresets[vP]])
-            )
+            if not vConfig.has_section("mixpresets"):
+                vConfig.add_section("mixpresets")
 
-        # ................................................
+            for vP in vMixPresets.keys():
+                vConfig.set(
+                    "mixpresets", vP, ";".join([str(vV) for vV in vMixPresets[vP]])
+                )
 
-        if vConfig.has_section("download"):
-            vConfig.remove_section("download")
-        vConfig.add_section("download")
+            # ................................................
 
-        for vK in self.vSettings:
-            if vK == "res":
-                vConfig.set("download", vK, self.vSettings[vK])
-            elif vK == "maps":
-                vConfig.set("download", vK, ";".join(self.vSettings[vK]))
+            if not vConfig.has_section("download"):
+                vConfig.add_section("download")
+            for vO in vConfig.options("download"):
+                if vO not in ("res", "maps"):
+                    vConfig.remove_option("download", vO)
 
-        # ................................................
+            vConfig.set("download", "res", vSettings["res"])
+            vConfig.set("download", "maps", ";".join(vSettings["maps"]))
 
-        f_MDir(self.gSettingsDir)
+            # ................................................
 
-        with open(self.gSettingsFile, "w+") as vFile:
-            vConfig.write(vFile)
+            vContent = io.StringIO()
+            vConfig.write(vContent)
+            self._write_settings(vContent.getvalue())
 
     # .........................................................................
 
@@ -958,15 +1477,18 @@ class c_Toolbox:
         self.vSettings["win_scale"] = prefs.system.ui_scale
 
     def get_ui_scale(self):
-        """Utility for fetching the ui scale, used in draw code."""
-        self.check_dpi()
+        """Utility for fetching the ui scale, used in draw code.
+
+        Returns the scale sampled by the last check_dpi() call, which
+        f_BuildUI does once per panel draw.
+        """
         return self.vSettings["win_scale"]
 
     def check_if_working(self):
         """See if the toolbox is currently running an operation."""
         # Not including `self.vGettingData` as that is just a flag for
         # displaying placeholders in the UI.
-        res = 1 in list(self.vWorking.values())
+        res = 1 in self.vWorking.values()
         if res:
             self.vWasWorking = res
         return res
@@ -987,9 +1509,7 @@ class c_Toolbox:
 
     def check_backplate(self, asset_name):
         """Return bool on whether this asset is a backplate."""
-        lwr = asset_name.lower()
-        return any(
-            lwr.startswith(vS) for vS in ["backdrop", "backplate"])
+        return asset_name.lower().startswith(BACKPLATE_PREFIXES)
 
     # .........................................................................
 
@@ -1012,51 +1532,45 @@ class c_Toolbox:
         elif area == "account":
             self.track_screen("my_account")
 
+    def reap_threads(self) -> None:
+        """Drops finished threads from vThreads."""
+        self.vThreads = [vT for vT in self.vThreads if vT.is_alive()]
+
+    def _submit_request(self, func: Callable, *args) -> None:
+        """Runs a small API request or signal function in the request pool."""
+        if self.request_pool is None:
+            return  # Not registered (anymore).
+        self.request_pool.submit(func, *args)
+
     def track_screen(self, area):
         """Signals input screen area in a background thread if opted in."""
         if not self._api._is_opted_in():
             return
-        vThread = threading.Thread(
-            target=self._api.signal_view_screen,
-            args=(area,),
-        )
-        vThread.daemon = 1
-        vThread.start()
-        self.vThreads.append(vThread)
+        self._submit_request(self._api.signal_view_screen, area)
 
     def register_notification(self, notice):
         """Stores and displays a new notification banner and signals event."""
         self.print_debug(0, "Creating notice: ", notice.notification_id)
         # Clear any notifications with the same id.
-        pre_existing = False
-        for existing_notice in self.notifications:
-            if existing_notice.notification_id == notice.notification_id:
-                self.notifications.remove(existing_notice)
-                pre_existing = True
-        self.notifications.append(notice)
+        remaining = [existing_notice for existing_notice in self.notifications
+                     if existing_notice.notification_id != notice.notification_id]
+        pre_existing = len(remaining) != len(self.notifications)
+        remaining.append(notice)
+        # Swap in the new list at once, the UI may iterate the old one.
+        self.notifications = remaining
 
         if not self._api._is_opted_in() or pre_existing:
             return
 
-        vThread = threading.Thread(
-            target=self._api.signal_view_notification,
-            args=(notice.notification_id,),
-        )
-        vThread.daemon = 1
-        vThread.start()
-        self.vThreads.append(vThread)
+        self._submit_request(self._api.signal_view_notification,
+                            notice.notification_id)
 
     def click_notification(self, notification_id, action):
         """Signals event for click notification."""
         if not self._api._is_opted_in():
             return
-        vThread = threading.Thread(
-            target=self._api.signal_click_notification,
-            args=(notification_id, action,),
-        )
-        vThread.daemon = 1
-        vThread.start()
-        self.vThreads.append(vThread)
+        self._submit_request(self._api.signal_click_notification,
+                            notification_id, action)
 
     def dismiss_notification(self, notification_index):
         """Signals dismissed notification in background if user opted in."""
@@ -1065,13 +1579,7 @@ class c_Toolbox:
 
         if not self._api._is_opted_in():
             return
-        vThread = threading.Thread(
-            target=self._api.signal_dismiss_notification,
-            args=(ntype,),
-        )
-        vThread.daemon = 1
-        vThread.start()
-        self.vThreads.append(vThread)
+        self._submit_request(self._api.signal_dismiss_notification, ntype)
 
     def finish_notification(self, notification_id):
         """To be called last in notification operators.
@@ -1091,25 +1599,13 @@ class c_Toolbox:
         """Signals an asset import in the background if user opted in."""
         if not self._api._is_opted_in() or asset_id == 0:
             return
-        vThread = threading.Thread(
-            target=self._api.signal_import_asset,
-            args=(asset_id,),
-        )
-        vThread.daemon = 1
-        vThread.start()
-        self.vThreads.append(vThread)
+        self._submit_request(self._api.signal_import_asset, asset_id)
 
     def signal_preview_asset(self, asset_id):
         """Signals an asset preview in the background if user opted in."""
         if not self._api._is_opted_in():
             return
-        vThread = threading.Thread(
-            target=self._api.signal_preview_asset,
-            args=(asset_id,),
-        )
-        vThread.daemon = 1
-        vThread.start()
-        self.vThreads.append(vThread)
+        self._submit_request(self._api.signal_preview_asset, asset_id)
 
     # .........................................................................
     def loginout_prepare(self) -> None:
@@ -1130,8 +1626,7 @@ class c_Toolbox:
 
         now = datetime.datetime.now()
         install_tstr = self.vSettings["first_enabled_time"]
-        install_t = datetime.datetime.strptime(
-            install_tstr, "%Y-%m-%d %H:%M:%S")
+        install_t = _parse_local_time(install_tstr)
         elapsed = now - install_t
         self.login_elapsed_s = int(elapsed.total_seconds())
         if self.login_elapsed_s <= 0:
@@ -1153,7 +1648,6 @@ class c_Toolbox:
         self.login_thread = threading.Thread(target=func)
         self.login_thread.daemon = 1
         self.login_thread.start()
-        self.vThreads.append(self.login_thread)
 
     def f_Login_with_website_check(self):
         self.login_determine_elapsed()
@@ -1188,17 +1682,19 @@ class c_Toolbox:
         self.vUser["plan_next_credits"] = None
         self.vUser["is_free_user"] = None
 
-        self.f_GetCredits()
-        self.f_GetCategories()
+        # Independent requests run side by side in the request pool,
+        # login does not wait for them.
+        self._submit_request(self.f_APIGetCredits)
+        self._submit_request(self.f_APIGetCategories)
+        # Fetch updated assets automatically.
+        self.f_GetAssets("my_assets", vMax=5000, vBackground=1, vUsePool=True)
 
         # Non threaded to avoid double request with GetAssets,
         # as this may trigger a change in the default search query
         # to be 'free'
         self.f_APIGetSubscriptionDetails()
 
-        # Fetch updated assets automatically.
-        self.f_GetAssets("my_assets", vMax=5000, vBackground=1)
-        self.f_GetAssets()
+        self.f_GetAssets(vUsePool=True)
 
         self.vLoginError = ""
 
@@ -1301,10 +1797,7 @@ class c_Toolbox:
         dbg = 0
         self.print_separator(dbg, "f_GetCategories")
 
-        vThread = threading.Thread(target=self.f_APIGetCategories)
-        vThread.daemon = 1
-        vThread.start()
-        self.vThreads.append(vThread)
+        self._submit_request(self.f_APIGetCategories)
 
     def f_GetCategoryChildren(self, vType, vCat):
         dbg = 0
@@ -1312,12 +1805,10 @@ class c_Toolbox:
 
         vChldrn = vCat["children"]
         for vC in vChldrn:
-            vPath = []
-            for vS in vC["path"].split("/"):
-                vS = " ".join([vS1.capitalize() for vS1 in vS.split("-")])
-                vPath.append(vS)
+            vPath = "/".join(
+                _prettify_category_segment(vS) for vS in vC["path"].split("/"))
 
-            vPath = ("/".join(vPath)).replace("/" + vType + "/", "/")
+            vPath = vPath.replace("/" + vType + "/", "/")
             vPath = vPath.replace("/Hdrs/", "/")
 
             if "Generators" in vPath:
@@ -1345,20 +1836,19 @@ class c_Toolbox:
             for vC in vReq.body:
                 vType = vC["name"]
                 self.print_debug(dbg, "f_APIGetCategories", vType)
-                if vType not in self.vCategories["poliigon"].keys():
-                    self.vCategories["poliigon"][vType] = {}
+                self.vCategories["poliigon"].setdefault(vType, {})
                 self.f_GetCategoryChildren(vType, vC)
 
             vDataFile = os.path.join(self.gSettingsDir, "TB_Categories.json")
-            with open(vDataFile, "w") as vWrite:
-                json.dump(self.vCategories, vWrite)
+            write_file_atomic(
+                vDataFile, json.dumps(self.vCategories, separators=(",", ":")))
         self.refresh_ui()
 
     # .........................................................................
 
     # @timer
     def f_GetAssets(self, vArea=None, vPage=None, vMax=None,
-                    vBackground=0, vUseThread=True):
+                    vBackground=0, vUseThread=True, vUsePool=False):
         dbg = 0
         self.print_separator(dbg, "f_GetAssets")
         self.print_debug(dbg, "f_GetAssets", vArea, vPage, vMax, vBackground)
@@ -1385,15 +1875,17 @@ class c_Toolbox:
 
         vSearch = self.vSearch[vArea]
 
-        vKey = "/".join([vArea] + self.vSettings['category'][vArea])
-        if vSearch != "":
-            vKey = "@".join(
-                [vArea] + self.vSettings['category'][vArea] + [vSearch]
-            )
+        vKey = self.get_asset_key(vArea, vSearch)
         self.print_debug(dbg, "f_GetAssets", vKey)
         now = time.time()
 
-        if vUseThread:
+        if vUsePool:
+            # Page is already marked as in progress above, so a redraw can
+            # not start the same request while it waits in the pool.
+            self._submit_request(
+                self.f_APIGetAssets,
+                vArea, vPage, vMax, vSearch, vKey, vBackground, now)
+        elif vUseThread:
             args = (vArea, vPage, vMax, vSearch, vKey, vBackground, now)
             vThread = threading.Thread(
                 target=self.f_APIGetAssets,
@@ -1406,6 +1898,13 @@ class c_Toolbox:
             self.f_APIGetAssets(
                 vArea, vPage, vMax, vSearch, vKey, vBackground, now)
 
+    def get_asset_key(self, vArea: str, vSearch: str) -> Tuple:
+        """Returns the vAssetsIndex key of an area's current category/search.
+
+        The key is a tuple (area, category path tuple, search string).
+        """
+        return (vArea, tuple(self.vSettings["category"][vArea]), vSearch)
+
     @reporting.handle_function(silent=True)
     def f_APIGetAssets(self, vArea, vPage, vMax, vSearch, vKey, vBackground, vTime):
         dbg = 0
@@ -1495,15 +1994,13 @@ class c_Toolbox:
                 f"{len(vData)} assets ({total} total)"
             )
 
-            vPages = vReq.body.get("total", 1) / self.vSettings.get("page", 1)
-            vPages = int(vPages + 0.999)
+            vPerPage = self.vSettings.get("page", 1)
+            vPages = (int(vReq.body.get("total", 1)) + vPerPage - 1) // vPerPage
 
             if not vBackground and vPage == self.vPage[vArea]:
                 self.vPages[vArea] = vPages
 
-            if vKey not in self.vAssetsIndex[vArea].keys():
-                self.vAssetsIndex[vArea][vKey] = {}
-                self.vAssetsIndex[vArea][vKey]["pages"] = vPages
+            self.vAssetsIndex[vArea].setdefault(vKey, {"pages": vPages})
 
             self.print_debug(
                 dbg, "f_APIGetAssets", len(vData), vPages, "pages")
@@ -1547,93 +2044,94 @@ class c_Toolbox:
         if vType == "Substances":
             return False
 
-        if vType not in self.vAssets[vArea].keys():
-            self.vAssets[vArea][vType] = {}
+        type_assets = self.vAssets[vArea].setdefault(vType, {})
 
         vName = vA["asset_name"]
 
-        if vArea == "my_assets" and vName not in self.vPurchased:
-            self.vPurchased.append(vName)
+        if vArea == "my_assets":
+            self.vPurchased.add(vName)
 
         # TODO: Turn this into a dataclass structure to avoid keying.
-        self.vAssets[vArea][vType][vName] = {}
-        self.vAssets[vArea][vType][vName]["name"] = vName
-        self.vAssets[vArea][vType][vName]["id"] = vA["id"]
-        self.vAssets[vArea][vType][vName]["slug"] = vA["slug"]
-        self.vAssets[vArea][vType][vName]["type"] = vType
-        self.vAssets[vArea][vType][vName]["files"] = []
-        self.vAssets[vArea][vType][vName]["maps"] = []
-        self.vAssets[vArea][vType][vName]["lods"] = []
-        self.vAssets[vArea][vType][vName]["sizes"] = []
-        self.vAssets[vArea][vType][vName]["workflows"] = []
-        self.vAssets[vArea][vType][vName]["vars"] = []
-        self.vAssets[vArea][vType][vName]["date"] = vA["published_at"]
-        self.vAssets[vArea][vType][vName]["credits"] = vA["credit"]
-        self.vAssets[vArea][vType][vName]["categories"] = vA["categories"]
-        self.vAssets[vArea][vType][vName]["preview"] = ""
-        self.vAssets[vArea][vType][vName]["thumbnails"] = []
-        self.vAssets[vArea][vType][vName]["quick_preview"] = vA["toolbox_previews"]
-
-        if "lods" in vA.keys():
-            self.vAssets[vArea][vType][vName]["lods"] = vA["lods"]
-
-        if len(vA["previews"]):
+        # Built locally and only stored once complete, so the UI never draws
+        # a partially loaded asset.
+        asset = {
+            "name": vName,
+            "id": vA["id"],
+            "slug": vA["slug"],
+            "type": vType,
+            "files": [],
+            "maps": [],
+            "lods": vA.get("lods", []),
+            "sizes": [],
+            "workflows": [],
+            "vars": [],
+            "date": vA["published_at"],
+            "credits": vA["credit"],
+            "categories": vA["categories"],
+            "preview": "",
+            "thumbnails": [],
+            "quick_preview": vA["toolbox_previews"],
+        }
+
+        previews = vA["previews"]
+        if len(previews):
             # Primary thumbnail previews
-            self.vAssets[vArea][vType][vName]["preview"] = vA["previews"][0]
+            asset["preview"] = previews[0]
             # Additional previews, skipping e.g. mview files.
-            valid = [x for x in vA["previews"]
-                     if ".png" in x or ".jpg" in x]
-            self.vAssets[vArea][vType][vName]["thumbnails"] = valid
+            valid = [x for x in previews
+                     if x.partition("?")[0].endswith(PREVIEW_EXTS)]
+            asset["thumbnails"] = valid
 
         # Asset-type based loading.
         if vType in ["Textures", "HDRIs", "Brushes"]:
             # Identify workflow types and sizes available.
-            all_sizes = []
-            if "render_schema" in vA.keys():
-                for schema in vA["render_schema"]:
-
-                    # Set workflow type
-                    workflow = schema.get('name', 'REGULAR')
-                    if workflow not in self.vAssets[vArea][vType][vName]["workflows"]:
-                        self.vAssets[vArea][vType][vName]["workflows"].append(workflow)
-
-                    # A single 'type' is a dict of a single map, such as:
-                    # {
-                    #    "type_code": "COL",  # COL here even if 'SPECULAR_COL'
-                    #    "type_name": "Diffuse",
-                    #    "type_preview": "diffuse.jpg",
-                    #    "type_options": ["1K", "2K", "3K", "4K"]
-                    # }
-                    if "types" in schema.keys():
-                        for vM in schema["types"]:
-                            all_sizes.extend(vM["type_options"])
-            all_sizes = list(set(all_sizes))
-            self.vAssets[vArea][vType][vName]["sizes"] = all_sizes
+            all_sizes = set()
+            workflows = asset["workflows"]
+            for schema in vA.get("render_schema", []):
+
+                # Set workflow type
+                workflow = schema.get('name', 'REGULAR')
+                if workflow not in workflows:
+                    workflows.append(workflow)
+
+                # A single 'type' is a dict of a single map, such as:
+                # {
+                #    "type_code": "COL",  # COL here even if 'SPECULAR_COL'
+                #    "type_name": "Diffuse",
+                #    "type_preview": "diffuse.jpg",
+                #    "type_options": ["1K", "2K", "3K", "4K"]
+                # }
+                for vM in schema.get("types", []):
+                    all_sizes.update(vM["type_options"])
+            asset["sizes"] = all_sizes  # Turned into a list below.
 
             # Workflow partitioned map names, e.g. "SPECULAR_COL"
-            self.vAssets[vArea][vType][vName]["maps"] = vA.get("type_options")
+            asset["maps"] = vA.get("type_options")
         elif vType == "Models":
 
-            self.vAssets[vArea][vType][vName]["workflows"] = ["METALNESS"]
+            asset["workflows"] = ["METALNESS"]
 
-            self.vAssets[vArea][vType][vName]["sizes"] = vA["render_schema"]["options"]
+            asset["sizes"] = vA["render_schema"]["options"]
 
         # Cleanup processing.
-        sorted_sizes = [vS for vS in self.vSizes
-                        if vS in self.vAssets[vArea][vType][vName]["sizes"]]
+        asset_sizes = asset["sizes"]
+        sorted_sizes = sorted(
+            {vS for vS in asset_sizes if vS in SIZE_ORDER},
+            key=SIZE_ORDER.__getitem__)
         if not sorted_sizes:
             # Keep the same sizes as they will exist online, but un-sorted.
-            self.print_debug(0, "Invalid sizes found",
-                             self.vAssets[vArea][vType][vName]["sizes"])
+            asset["sizes"] = list(asset_sizes)
+            self.print_debug(0, "Invalid sizes found", asset_sizes)
             # Disabling this as volume can be large, given number of times
             # already seen during UAT.
             # reporting.capture_message(
             #     "asset_size_empty",
-            #     self.vAssets[vArea][vType][vName]["sizes"],
+            #     asset_sizes,
             #     'error')
         else:
-            self.vAssets[vArea][vType][vName]["sizes"] = sorted_sizes
+            asset["sizes"] = sorted_sizes
 
+        type_assets[vName] = asset
         self.vAssetsIndex[vArea][vKey][vIdx] = [vType, vName]
 
         return True  # Indicates structure was loaded.
@@ -1652,9 +2150,7 @@ class c_Toolbox:
         vPageAssets = []
         vPageCount = 0
         if vArea in self.vAssetsIndex.keys():
-            vKey = "/".join([vArea] + self.vSettings['category'][vArea])
-            if vSearch != "":
-                vKey = "@".join([vArea] + self.vSettings['category'][vArea] + [vSearch])
+            vKey = self.get_asset_key(vArea, vSearch)
 
             self.print_debug(dbg, "f_GetPageAssets", vKey)
 
@@ -1698,33 +2194,59 @@ class c_Toolbox:
         else:
             vAssetType = self.vSettings["category"]["imported"][0]
 
+            # Search only gets applied with three or more characters
+            vSearchKey = vSearch.lower() if len(vSearch) >= 3 else ""
+            vCacheKey = (vArea, vAssetType, vSearchKey,
+                         self.vSettings["page"], self._local_assets_version)
+            vCached = self._sorted_assets_cache.get(vCacheKey)
+            if vCached is not None:
+                vSortedAssets, self.vPages[vArea] = vCached
+                return vSortedAssets
+
             vSortedAssets = []
-            for vType in self.imported_assets.keys():
-                if vAssetType in ["All Assets", vType]:
-                    for vA in self.imported_assets[vType].keys():
-                        if (
-                            len(vSearch) >= 3
-                            and vSearch.lower() not in vA.lower()
-                        ):
-                            continue
+            for vType, vNames in self.imported_names_lc.items():
+                if vAssetType not in ["All Assets", vType]:
+                    continue
+                vLocal = self.vAssets["local"].get(vType, {})
+                if vSearchKey:
+                    vNames = [(vLC, vA) for vLC, vA in vNames
+                              if vSearchKey in vLC]
+                for _, vA in vNames:
+                    if vA in vLocal:
+                        vSortedAssets.append(vLocal[vA])
+
+            vPerPage = self.vSettings["page"]
+            self.vPages[vArea] = (len(vSortedAssets) + vPerPage - 1) // vPerPage
+
+            if vCacheKey[-1] != self._sorted_assets_cache_version:
+                # Local or imported assets changed, forget outdated results
+                self._sorted_assets_cache = {}
+                self._sorted_assets_cache_version = vCacheKey[-1]
+            self._sorted_assets_cache[vCacheKey] = (
+                vSortedAssets, self.vPages[vArea])
 
-                        if vType in self.vAssets["local"].keys():
-                            if vA in self.vAssets["local"][vType].keys():
-                                vSortedAssets.append(self.vAssets["local"][vType][vA])
+            return vSortedAssets
 
-            self.vPages[vArea] = int(
-                (len(vSortedAssets) / self.vSettings["page"]) + 0.99999
-            )
+    def _local_assets_changed(self) -> None:
+        """Invalidates cached f_GetAssetsSorted results of local areas.
 
-            return vSortedAssets
+        To be called whenever vAssets["local"] or imported_assets change.
+        """
+        self._local_assets_version += 1
 
     def get_poliigon_asset(self, vType, vAsset):
         """Get the data for a single explicit asset of a given type."""
         if vType not in self.vAssets["poliigon"]:
             self.print_debug(0, f"Was missing {vType}, populated now")
-            self.vAssets["poliigon"][vType] = {}
+        type_assets = self.vAssets["poliigon"].setdefault(vType, {})
+
+        if vAsset not in type_assets:
+            # Purchased assets are usually known from my_assets already,
+            # no need to block on a request for them.
+            vAData = self.vAssets["my_assets"].get(vType, {}).get(vAsset)
+            if vAData is not None:
+                return vAData
 
-        if vAsset not in self.vAssets["poliigon"][vType]:
             # Handle a given datapoint being missing at moment of request
             # and fetch it.
             # raise Exception("Asset is not avaialble")
@@ -1739,43 +2261,78 @@ class c_Toolbox:
                 f"Had to fetch asset info for {vAsset}")
             vArea = "poliigon"
             vSearch = vAsset
-            vKey = "@".join([vArea] + self.vSettings['category'][vArea] + [vSearch])
+            vKey = self.get_asset_key(vArea, vSearch)
 
             vPage = 0
             vMax = 100
             self.f_APIGetAssets(
                 vArea, vPage, vMax, vSearch, vKey, 0, time.time())
 
-            if not self.vAssets["poliigon"][vType].get(vAsset):
+            if not type_assets.get(vAsset):
                 raise RuntimeError("Failed to fetch asset information")
             else:
                 # Report this cache miss, as generally shouln't happen.
                 reporting.capture_message("get_asset_miss", vAsset, 'error')
 
-        return self.vAssets["poliigon"][vType].get(vAsset)
+        return type_assets.get(vAsset)
+
+    def _rebuild_asset_locations(self) -> None:
+        """Rebuilds the lookups used by get_data_for_asset_id/name.
+
+        Only the location (type, name) of an asset gets stored, the data itself
+        is always taken from vAssets, so the lookups can not hand out stale
+        data. Locations which turn out to be outdated trigger a rebuild.
+        """
+        locations_by_id = {}
+        types_by_name = {}
+        for area in ASSET_LOOKUP_AREAS:
+            for cat, assets in list(self.vAssets[area].items()):
+                for asset, data in list(assets.items()):
+                    types_by_name.setdefault(asset, cat)
+                    asset_id = data.get("id")
+                    if asset_id is not None:
+                        locations_by_id.setdefault(asset_id, (cat, asset))
+        self._asset_locations_by_id = locations_by_id
+        self._asset_types_by_name = types_by_name
+
+    def _get_asset_at(self, cat, asset, asset_id=None):
+        """Returns an asset's data from the first area containing it."""
+        for area in ASSET_LOOKUP_AREAS:
+            data = self.vAssets[area].get(cat, {}).get(asset)
+            if data is None:
+                continue
+            if asset_id is None or data.get("id") == asset_id:
+                return data
+        return None
 
     def get_data_for_asset_id(self, asset_id):
         """Get the data structure for an asset by asset_id alone."""
-        area_order = ["poliigon", "my_assets", "local"]
-        for area in area_order:
-            subcats = list(self.vAssets[area])
-            for cat in subcats:  # e.g. HDRIs
-                for asset in self.vAssets[area][cat]:
-                    if self.vAssets[area][cat][asset].get("id") == asset_id:
-                        return self.vAssets[area][cat][asset]
+        location = self._asset_locations_by_id.get(asset_id)
+        if location is not None:
+            data = self._get_asset_at(*location, asset_id=asset_id)
+            if data is not None:
+                return data
+
+        self._rebuild_asset_locations()
+        location = self._asset_locations_by_id.get(asset_id)
+        if location is not None:
+            return self._get_asset_at(*location, asset_id=asset_id) or {}
 
         # Failed to fetch asset, return empty structure.
         return {}
 
     def get_data_for_asset_name(self, asset_name):
         """Get the data structure for an asset by asset_name alone."""
-        area_order = ["poliigon", "my_assets", "local"]
-        for area in area_order:
-            subcats = list(self.vAssets[area])
-            for cat in subcats:
-                for asset in self.vAssets[area][cat]:
-                    if asset == asset_name:
-                        return self.vAssets[area][cat][asset]
+        cat = self._asset_types_by_name.get(asset_name)
+        if cat is not None:
+            data = self._get_asset_at(cat, asset_name)
+            if data is not None:
+                return data
+
+        self._rebuild_asset_locations()
+        cat = self._asset_types_by_name.get(asset_name)
+        if cat is not None:
+            return self._get_asset_at(cat, asset_name) or {}
 
         # Failed to fetch asset, return empty structure.
         return {}
@@ -1784,27 +2341,7 @@ class c_Toolbox:
         dbg = 0
         self.print_separator(dbg, "f_DummyAssets")
 
-        vDummyAssets = []
-
-        vDummy = {}
-        vDummy["name"] = "dummy"
-        vDummy["slug"] = ""
-        vDummy["type"] = ""
-        vDummy["files"] = []
-        vDummy["maps"] = []
-        vDummy["lods"] = []
-        vDummy["sizes"] = []
-        vDummy["vars"] = []
-        vDummy["date"] = ""
-        vDummy["credits"] = 0
-        vDummy["categories"] = []
-        vDummy["preview"] = ""
-        vDummy["thumbnails"] = []
-
-        for i in range(self.vSettings["page"]):
-            vDummyAssets.append(vDummy)
-
-        return vDummyAssets
+        return [DUMMY_ASSET] * self.vSettings["page"]
 
     def f_UpdateData(self):
         dbg = 0
@@ -1812,7 +2349,7 @@ class c_Toolbox:
 
         vDFile = self.gSettingsDir + "/Poliigon_Data.ini"
 
-        vConfig = ConfigParser.ConfigParser()
+        vConfig = configparser.RawConfigParser()
         vConfig.optionxform = str
         if f_Ex(vDFile):
             vConfig.read(vDFile)
@@ -1867,10 +2404,7 @@ class c_Toolbox:
         dbg = 0
         self.print_separator(dbg, "f_GetCredits")
 
-        vThread = threading.Thread(target=self.f_APIGetCredits)
-        vThread.daemon = 1
-        vThread.start()
-        self.vThreads.append(vThread)
+        self._submit_request(self.f_APIGetCredits)
 
     @reporting.handle_function(silent=True)
     def f_APIGetCredits(self):
@@ -1893,14 +2427,21 @@ class c_Toolbox:
 
     # .........................................................................
 
-    def f_GetUserInfo(self):
+    @reporting.handle_function(silent=True)
+    def f_APIGetUserBundle(self):
+        """Fetches credits, user info and subscription in a single thread.
+
+        The requests run back to back, so they share the API's connection
+        instead of occupying three threads at once.
+        """
         dbg = 0
-        self.print_separator(dbg, "f_GetUserInfo")
+        self.print_separator(dbg, "f_APIGetUserBundle")
 
-        vThread = threading.Thread(target=self.f_APIGetUserInfo)
-        vThread.daemon = 1
-        vThread.start()
-        self.vThreads.append(vThread)
+        self.f_APIGetCredits()
+        self.f_APIGetUserInfo()
+        self.f_APIGetSubscriptionDetails()
+
+    # .........................................................................
 
     @reporting.handle_function(silent=True)
     def f_APIGetUserInfo(self):
@@ -1917,15 +2458,6 @@ class c_Toolbox:
 
     # .........................................................................
 
-    def f_GetSubscriptionDetails(self):
-        dbg = 0
-        self.print_separator(dbg, "f_GetSubscriptionDetails")
-
-        vThread = threading.Thread(target=self.f_APIGetSubscriptionDetails)
-        vThread.daemon = 1
-        vThread.start()
-        self.vThreads.append(vThread)
-
     @reporting.handle_function(silent=True)
     def f_APIGetSubscriptionDetails(self):
         """Fetches the current user's subscription status."""
@@ -1942,17 +2474,11 @@ class c_Toolbox:
                 self.vUser["plan_name"] = plan["plan_name"]
                 self.vUser["plan_credit"] = plan.get("plan_credit", None)
 
-                # Extract "2022-08-19" from "2022-08-19 23:58:37"
-                renew = plan.get("next_subscription_renewal_date", "")
-                if renew is None:
-                    renew = ""
-                renew = renew.split(" ")[0]
-                self.vUser["plan_next_renew"] = renew
+                renew = plan.get("next_subscription_renewal_date") or ""
+                self.vUser["plan_next_renew"] = _date_only(renew)
 
                 next_credits = plan.get("next_credit_renewal_date", "")
-                if next_credits is not None:
-                    next_credits = next_credits.split(" ")[0]
-                self.vUser["plan_next_credits"] = next_credits
+                self.vUser["plan_next_credits"] = _date_only(next_credits)
                 # Here we are sure: sub == paying user
                 # (regardless of any credits)
                 force_paying_user = True
@@ -1997,15 +2523,22 @@ class c_Toolbox:
         dbg = 0
         self.print_separator(dbg, "f_QueuePreview")
 
-        vThread = threading.Thread(target=self.f_DownloadPreview,
-                                   args=(vAsset, thumbnail_index))
-        vThread.daemon = 1
-        vThread.start()
-        self.vThreads.append(vThread)
+        if self.preview_pool is None:
+            self.vPreviewsDownloading.discard(vAsset)
+            return  # Not registered (anymore).
+        self.preview_pool.submit(
+            self.f_DownloadPreview, vAsset, thumbnail_index)
 
     @reporting.handle_function(silent=True)
     def f_DownloadPreview(self, vAsset, thumbnail_index):
         """Download a single thumbnail preview for a single asset."""
+        try:
+            self._download_preview(vAsset, thumbnail_index)
+        finally:
+            # Always remove from download queue, also on early exits
+            self.vPreviewsDownloading.discard(vAsset)
+
+    def _download_preview(self, vAsset, thumbnail_index):
         dbg = 0
         self.print_separator(dbg, "f_DownloadPreview")
 
@@ -2016,11 +2549,13 @@ class c_Toolbox:
         target_file = self.f_GetThumbnailPath(vAsset, thumbnail_index)
         target_base, target_ext = os.path.splitext(target_file)
 
+        # Ensure the folder once, it may have been removed since register.
+        f_MDir(self.gOnlinePreviews)
+
         # Check if a partial or complete download already exists.
+        # target_base is already a full path within gOnlinePreviews.
         for vExt in [".jpg", ".png", "X.jpg", "X.png"]:
-            f_MDir(self.gOnlinePreviews)
-
-            vQPrev = os.path.join(self.gOnlinePreviews, target_base + vExt)
+            vQPrev = target_base + vExt
             if f_Ex(vQPrev):
                 self.print_debug(dbg, "f_DownloadPreview", vQPrev)
                 if "X" in vExt:
@@ -2038,27 +2573,26 @@ class c_Toolbox:
         # .....................................................................
 
         # Download to a temp filename.
-        vPrev = os.path.join(self.gOnlinePreviews,
-                             target_base + "X" + target_ext)
+        vPrev = target_base + "X" + target_ext
+
+        vAreaAssets = self.vAssets[self.vSettings["area"]]
+        vType = self._asset_types_by_name.get(vAsset)
+        vAData = vAreaAssets.get(vType, {}).get(vAsset)
+        if vAData is None:
+            # Not (yet) in the location index, check each asset type.
+            for vTypeAssets in vAreaAssets.values():
+                if vAsset in vTypeAssets:
+                    vAData = vTypeAssets[vAsset]
+                    break
 
         vURL = None
-        for vType in self.vAssets[self.vSettings["area"]]:
-            # One of Models, HDRIs, Textures.
-            if vAsset in self.vAssets[self.vSettings["area"]][vType]:
-                cdn_url = (
-                    "https://poliigon.com/cdn-cgi/image/"
-                    "width={size},sharpen=1,q=75,f=auto/{url}")
-
-                # This specific combo, width=300, sharpen=1, and q=75 will
-                # ensure we make use of the same caching as the website.
-                if thumbnail_index == 0:
-                    base_url = self.vAssets[self.vSettings["area"]][vType][vAsset]["preview"]
-                    vURL = cdn_url.format(size=300, url=base_url)
-                else:
-                    base_url = self.vAssets[self.vSettings["area"]][vType][
-                        vAsset]["thumbnails"][thumbnail_index - 1]
-                    vURL = cdn_url.format(size=1024, url=base_url)
-                break
+        if vAData is not None:
+            if thumbnail_index == 0:
+                vURL = PREVIEW_CDN_URL.format(
+                    size=300, url=vAData["preview"])
+            else:
+                vURL = PREVIEW_CDN_URL.format(
+                    size=1024, url=vAData["thumbnails"][thumbnail_index - 1])
 
         if vURL:
             self.print_debug(dbg, "f_DownloadPreview", vPrev, vURL)
@@ -2085,120 +2619,101 @@ class c_Toolbox:
                 f"Failed to find preview url for {vAsset}",
                 'error')
 
-        # Always remove from download queue (can have thread conflicts, so try)
-        try:
-            self.vPreviewsDownloading.remove(vAsset)
-        except ValueError:  # Already removed.
-            pass
-
     # .........................................................................
 
     def check_if_purchase_queued(self, asset_id):
         """Checks if an asset is queued for purchase"""
-        queued = asset_id in list(self.vPurchaseQueue.keys())
-        return queued
+        return asset_id in self.vPurchaseQueue
 
-    def queue_purchase(self, asset_id, asset_data, start_thread=True):
-        """Adds an asset to the purchase_queue and starts threads"""
+    def queue_purchase(self, asset_id, asset_data):
+        """Adds an asset to the purchase queue and submits it to the pool"""
         self.vPurchaseQueue[asset_id] = asset_data
-        self.purchase_queue.put(asset_id)
         self.print_debug(0, f"Queued asset {asset_id}")
-
-        self.purchase_threads = [
-            thread for thread in self.purchase_threads if thread.is_alive()]
-
-        if start_thread and len(self.purchase_threads) < MAX_PURCHASE_THREADS:
-            thread = threading.Thread(target=self.purchase_assets_thread)
-            thread.daemon = 1
-            thread.start()
-            self.purchase_threads.append(thread)
+        self.purchase_pool.submit(self.purchase_asset_thread, asset_id)
 
     @reporting.handle_function(silent=True)
-    def purchase_assets_thread(self):
-        """Thread to purchase queue of assets"""
-        while self.purchase_queue.qsize() > 0:
-            try:
-                asset_id = int(self.purchase_queue.get_nowait())
-            except queue.Empty:
-                time.sleep(0.1)
-                continue
+    def purchase_asset_thread(self, asset_id):
+        """Pool job to purchase a single queued asset"""
+        if not self.vRunning:
+            print("Cancelling in progress purchases")
+            return
 
-            if not self.vRunning:
-                print("Cancelling in progress purchases")
-                return
+        asset_data = self.vPurchaseQueue[asset_id]
 
-            asset_data = self.vPurchaseQueue[asset_id]
+        asset = asset_data['name']
 
-            asset = asset_data['name']
+        # Metadata required to pass forward
+        wm_props = bpy.context.window_manager.poliigon_props
+        search = wm_props.search_poliigon.lower()
 
-            # Metadata required to pass forward
-            wm_props = bpy.context.window_manager.poliigon_props
-            search = wm_props.search_poliigon.lower()
+        category = _category_slug(tuple(self.vActiveCat))
+        self.print_debug(0, "Active cat: ", self.vActiveCat, category)
 
-            # Get the slug format of the active category, e.g.
-            # from ["All Models"] to "/"
-            # from ["Models", "Bathroom"] to "/models/bathroom"
-            # and undo transforms of f_GetCategoryChildren.
-            # TODO: Refactor f_GetCategoryChildren as part of Core migration.
-            category = "/" + "/".join(
-                [cat.lower().replace(" ", "-") for cat in self.vActiveCat]
-            )
-            if category.startswith("/hdris/"):
-                category = category.replace("/hdris/", "/hdrs/")
-            elif category == "/all-assets":
-                category = "/"
-            self.print_debug(0, "Active cat: ", self.vActiveCat, category)
-
-            req = self._api.purchase_asset(asset_id, search, category)
-            del self.vPurchaseQueue[asset_id]  # Remove regardless, for ui draw
-
-            if req.ok:
-                # Append purchased if success, or if the asset is free.
-                self.vPurchased.append(asset)
-                self.vAssets["my_assets"][asset_data["type"]][asset] = asset_data
-
-                # Process auto download if setting enabled.
-                if self.vSettings["auto_download"]:
-                    self.vDownloadQueue[asset_id] = {
-                        "data": asset_data,
-                        "size": None,
-                        "download_size": None
-                    }
-                    self.queue_download(asset_id)
+        req = self._api.purchase_asset(asset_id, search, category)
+        del self.vPurchaseQueue[asset_id]  # Remove regardless, for ui draw
+
+        if req.ok:
+            # Add purchased if success, or if the asset is free.
+            self.vPurchased.add(asset)
+            self.vAssets["my_assets"].setdefault(
+                asset_data["type"], {})[asset] = asset_data
+
+            # Process auto download if setting enabled.
+            if self.vSettings["auto_download"]:
+                self.vDownloadQueue[asset_id] = {
+                    "data": asset_data,
+                    "size": None,
+                    "download_size": None
+                }
+                self.queue_download(asset_id)
 
+        else:
+            self.print_debug(
+                0, f"Failed to purchase asset {asset_id} {asset}",
+                str(req.error), str(req.body))
+
+            # Check the reason for failure.
+            if "enough credits" in req.error:
+                ui_err = DisplayError(
+                    asset_id=asset_id,
+                    asset_name=asset,
+                    button_label="Need credits",
+                    description=f"{req.error})"
+                )
             else:
-                self.print_debug(
-                    0, f"Failed to purchase asset {asset_id} {asset}",
-                    str(req.error), str(req.body))
-
-                # Check the reason for failure.
-                if "enough credits" in req.error:
-                    ui_err = DisplayError(
-                        asset_id=asset_id,
-                        asset_name=asset,
-                        button_label="Need credits",
-                        description=f"{req.error})"
-                    )
-                else:
-                    ui_err = DisplayError(
-                        asset_id=asset_id,
-                        asset_name=asset,
-                        button_label="Failed, retry",
-                        description=f"Error during purchase, please try again ({req.error})"
-                    )
-                self.ui_errors.append(ui_err)
+                ui_err = DisplayError(
+                    asset_id=asset_id,
+                    asset_name=asset,
+                    button_label="Failed, retry",
+                    description=f"Error during purchase, please try again ({req.error})"
+                )
+            self.ui_errors.append(ui_err)
+
+        # Clear cached data in index to prompt refresh after purchase
+        self._invalidate_my_assets_index(asset_data["type"])
+
+        # Runs in this same thread. Only the purchase finishing last needs
+        # to update the credits balance, earlier ones would be outdated
+        # anyway. Purchases finishing at the same time may still both
+        # request, which is ok.
+        if not self.vPurchaseQueue:
+            self.f_APIGetCredits()
+        self.vRedraw = 1
+        self.refresh_ui()
 
-            # Clear cached data in index to prompt refresh after purchase
-            self.vAssetsIndex["my_assets"] = {}
+    def _invalidate_my_assets_index(self, asset_type: str) -> None:
+        """Drops my_assets index entries, which may list an asset type.
 
-            # Runs in this same thread, and if there are many purchase
-            # events then there may be multiple executions of this. It is
-            # important that the last purchase always does update the
-            # credits balance, so this tradeoff is ok to have overlapping
-            # requests potentially.
-            self.f_APIGetCredits()
-            self.vRedraw = 1
-            self.refresh_ui()
+        Entries of other asset type categories remain valid. Searches get
+        dropped regardless, as the server decides what matches them.
+        """
+        index = self.vAssetsIndex["my_assets"]
+        self.vAssetsIndex["my_assets"] = {
+            vKey: vIndex for vKey, vIndex in list(index.items())
+            if not vKey[2]
+            and vKey[1]
+            and vKey[1][0] not in ("All Assets", asset_type)
+        }
 
     # .........................................................................
 
@@ -2223,7 +2738,7 @@ class c_Toolbox:
         self.vPreviews.clear()
         if icons_only is False:
             self.notifications = []
-            self.vPurchased = []
+            self.vPurchased = set()
 
             self.vAssetsIndex["poliigon"] = {}
             self.vAssetsIndex["my_assets"] = {}
@@ -2239,9 +2754,7 @@ class c_Toolbox:
         self.vGettingData = 0
 
         if icons_only is False:
-            self.f_APIGetCredits()
-            self.f_APIGetUserInfo()
-            self.f_GetSubscriptionDetails()
+            self.f_APIGetUserBundle()
 
         self.last_texture_size = {}
 
@@ -2250,9 +2763,8 @@ class c_Toolbox:
 
     def check_if_download_queued(self, asset_id):
         """Checks if an asset is queued for download"""
-        cancelled = asset_id in self.vDownloadCancelled
-        queued = asset_id in list(self.vDownloadQueue.keys())
-        return queued and not cancelled
+        return (asset_id in self.vDownloadQueue
+                and asset_id not in self.vDownloadCancelled)
 
     def get_maps_by_workflow(self, maps, workflow):
         """Download only relevant maps.
@@ -2262,13 +2774,15 @@ class c_Toolbox:
 
         # Some maps in API belong only to a single workflow, even though
         # they are the same for both.
-        force_dl = ["IDMAP"]
+        force_dl = ("IDMAP", )
 
         # Each map should be in the form of "WORKFLOW_MAPNAME".
-        target_maps = [
-            m.split("_", maxsplit=1)[-1] for m in maps
-            if m.startswith(workflow) or m.split("_", 1)[-1] in force_dl]
-        return list(set(target_maps))
+        target_maps = set()
+        for m in maps:
+            map_name = m.split("_", maxsplit=1)[-1]
+            if m.startswith(workflow) or map_name in force_dl:
+                target_maps.add(map_name)
+        return list(target_maps)
 
     def check_need_hdri_sizes(self,
                               asset_data: Dict,
@@ -2301,14 +2815,24 @@ class c_Toolbox:
         need_jpg = True
         for path_asset in asset_data["files"]:
             filename = os.path.basename(path_asset)
-            is_exr = filename.lower().endswith(".exr")
-            is_jpg = filename.lower().endswith(".jpg")
-            is_jpg &= "_JPG" in filename
+            ext = filename[-4:].lower()
+            if ext not in (".exr", ".jpg"):
+                continue
+            # Compare the exact size, "16K" must not match "6K"
+            match_object = SIZE_TOKEN_RE.search(filename)
+            if match_object is None:
+                continue
+            size = match_object.group(1)
 
-            if is_exr and size_exr in filename:
+            if need_exr and ext == ".exr" and size == size_exr:
                 need_exr = False
-            elif is_jpg and size_jpg in filename:
+            elif (need_jpg and ext == ".jpg" and "_JPG" in filename
+                    and size == size_jpg):
                 need_jpg = False
+            else:
+                continue
+            if not need_exr and not need_jpg:
+                break
         if not need_exr and not need_jpg:
             # we should not be here, fallback old behavior
             need_exr = True
@@ -2364,13 +2888,10 @@ class c_Toolbox:
         }
 
         if asset_data['type'] in ['Textures', 'HDRIs']:
-            download_data['assets'][0]['workflows'] = []
-            if 'METALNESS' in asset_data['workflows']:
-                download_data['assets'][0]['workflows'] = ['METALNESS']
-            elif 'REGULAR' in asset_data['workflows']:
-                download_data['assets'][0]['workflows'] = ['REGULAR']
-            elif 'SPECULAR' in asset_data['workflows']:
-                download_data['assets'][0]['workflows'] = ['SPECULAR']
+            workflow = next((wf for wf in WORKFLOW_PRIORITY
+                             if wf in asset_data['workflows']), None)
+            download_data['assets'][0]['workflows'] = (
+                [workflow] if workflow is not None else [])
 
             maps = self.get_maps_by_workflow(
                 asset_data['maps'],
@@ -2392,11 +2913,12 @@ class c_Toolbox:
             # No special data needed for Brushes
             pass
 
+        asset_sizes = set(asset_data['sizes'])
         download_data['assets'][0]['sizes'] = [
-            size for size in sizes if size in asset_data['sizes']]
+            size for size in sizes if size in asset_sizes]
         if not len(download_data['assets'][0]['sizes']):
             for size in reversed(self.vSizes):
-                if size in asset_data['sizes']:
+                if size in asset_sizes:
                     download_data['assets'][0]['sizes'] = [size]
                     break
         if not download_data['assets'][0]['sizes']:
@@ -2433,33 +2955,47 @@ class c_Toolbox:
             del self.last_texture_size[asset_name]
 
     def queue_download(self, asset_id):
-        """Adds an asset to the purchase_queue and starts thread if necessary"""
-        self.download_queue.put(asset_id)
-
-        self.download_threads = [
-            thread for thread in self.download_threads if thread.is_alive()]
-
-        if len(self.download_threads) < MAX_DOWNLOAD_THREADS:
-            thread = threading.Thread(target=self.download_assets_thread)
-            thread.daemon = 1
-            thread.start()
-            self.download_threads.append(thread)
+        """Submits a queued asset to the download pool"""
+        # Drop a stale cancel, e.g. pressed just as a former download ended.
+        self.vDownloadCancelled.discard(asset_id)
+        fut = self.download_pool.submit(self.download_asset_thread, asset_id)
+        self._download_futures[asset_id] = fut
+        fut.add_done_callback(
+            lambda done, asset_id=asset_id: self._forget_download(
+                asset_id, done))
+
+    def _forget_download(self, asset_id, fut):
+        """Drops the future of a finished or cancelled download."""
+        if self._download_futures.get(asset_id) is fut:
+            del self._download_futures[asset_id]
+
+    def cancel_download(self, asset_id):
+        """Cancels a queued or running download.
+
+        Downloads still waiting in the pool get dropped right away, running
+        ones stop on their next progress update.
+        """
+        fut = self._download_futures.get(asset_id)
+        if fut is not None and fut.cancel():
+            self.vDownloadQueue.pop(asset_id, None)
+            self.vRedraw = 1
+            return
+        self.vDownloadCancelled.add(asset_id)
 
     @reporting.handle_function(silent=True)
-    def download_assets_thread(self):
-        """Thread to download queue of assets"""
-        while self.download_queue.qsize() > 0:
-            if not self.vRunning:
-                print("Cancelling in progress downloads")
-                return
+    def download_asset_thread(self, asset_id):
+        """Pool job to download a single queued asset"""
+        if not self.vRunning:
+            print("Cancelling in progress downloads")
+            return
 
-            try:
-                asset_id = int(self.download_queue.get_nowait())
-            except queue.Empty:
-                time.sleep(0.1)
-                continue
+        if asset_id in self.vDownloadCancelled:
+            # Cancelled while still waiting in the pool's queue.
+            self.vDownloadCancelled.discard(asset_id)
+            self.vDownloadQueue.pop(asset_id, None)
+            return
 
-            self.download_asset(asset_id)
+        self.download_asset(asset_id)
 
     def download_asset(self, asset_id):
         """Gathers download params and calls download function"""
@@ -2473,13 +3009,18 @@ class c_Toolbox:
         source_dir = self.vSettings["library"]
         primary_files = []
         add_files = []
-        if asset in self.vAssets["local"][atype].keys():
-            for file in self.vAssets["local"][atype][asset]["files"]:
-                if f_Ex(file):
-                    if file.split(asset, 1)[0] == source_dir:
-                        primary_files.append(file)
-                    else:
-                        add_files.append(file)
+        local_asset = self.vAssets["local"][atype].get(asset)
+        if local_asset is not None:
+            # Files directly in the library start with its path, followed
+            # by the asset name (same as file.split(asset, 1)[0] == source_dir)
+            primary_prefix = source_dir + asset
+            for file in local_asset["files"]:
+                if not f_Ex(file):
+                    continue
+                if file.startswith(primary_prefix):
+                    primary_files.append(file)
+                else:
+                    add_files.append(file)
 
             self.print_debug(0, "download_asset",
                              "Found asset files in primary library:",
@@ -2517,24 +3058,20 @@ class c_Toolbox:
         asset_dir = os.path.splitext(dst_file)[0]
 
         if f_Ex(asset_dir):
-            asset_files = []
-            for path, dirs, files in os.walk(asset_dir):
-                # NOTE: While os.path.join() is tempting here,
-                #       all over P4B "a" + "/" + "b" is used.
-                #       On Win join() will introduce a backslash,
-                #       which then leads to paths no longer matching their
-                #       "all slash" counter parts, potentially causing double
-                #       imports.
-                # TODO(Andreas): Rework path handling to make use of
-                #                os.path.normpath() and os.path.join().
-                asset_files += [path + "/" + file for file in files]
+            # Unzipping already listed the files, only rescan without it.
+            unzipped_files = res.body.get("files")
+            if unzipped_files is not None:
+                asset_files = set(unzipped_files)
+            else:
+                asset_files = set(self._iter_files_recursive(asset_dir))
 
             # Ensure previously found asset files are added back
-            asset_files += primary_files + add_files
-            asset_files = list(set(asset_files))
+            asset_files.update(primary_files)
+            asset_files.update(add_files)
 
             self.vAssets["local"][atype][asset] = self.build_local_asset_data(
                 asset, atype, asset_files)
+            self._local_assets_changed()
 
         try:
             del self.vDownloadQueue[asset_id]
@@ -2571,7 +3108,7 @@ class c_Toolbox:
             )
         elif res.error == api.ERR_UNZIP_ERROR:
             res.body["asset"] = asset_id
-            reporting.capture_message(
+            self._queue_error_report(
                 "download_asset_failed_unzip", str(res.body), "error")
             ui_err = DisplayError(
                 asset_id=asset_id,
@@ -2590,7 +3127,7 @@ class c_Toolbox:
             )
         else:
             # An unhandled download issue, capture in general sentry message.
-            reporting.capture_message(
+            self._queue_error_report(
                 "download_asset_failed", res.error, "error")
             ui_err = DisplayError(
                 asset_id=asset_id,
@@ -2602,10 +3139,48 @@ class c_Toolbox:
         self.ui_errors.append(ui_err)
         self.vRedraw = 1
 
+    def _queue_error_report(self, message: str, code_msg: str, level: str):
+        """Schedules a sentry message, without blocking the calling thread.
+
+        Identical reports within ERROR_REPORT_DELAY_S get sent as a single
+        message with a repeat count, e.g. when all running downloads fail
+        due to a network outage.
+        """
+        key = (message, str(code_msg), level)
+        with self._error_report_lock:
+            count = self._pending_error_reports.get(key, 0)
+            self._pending_error_reports[key] = count + 1
+            if self._error_report_timer is not None:
+                return  # Pending send will pick up this report.
+            self._error_report_timer = threading.Timer(
+                ERROR_REPORT_DELAY_S, self._flush_error_reports_thread)
+            self._error_report_timer.daemon = True
+            self._error_report_timer.start()
+
+    @reporting.handle_function(silent=True)
+    def _flush_error_reports_thread(self):
+        """Timer thread sending the reports scheduled by _queue_error_report."""
+        self.flush_error_reports_now()
+
+    def flush_error_reports_now(self):
+        """Cancels any pending timer and sends the queued error reports now."""
+        with self._error_report_lock:
+            if self._error_report_timer is not None:
+                self._error_report_timer.cancel()
+                self._error_report_timer = None
+            reports = self._pending_error_reports
+            self._pending_error_reports = {}
+
+        for (message, code_msg, level), count in reports.items():
+            if count > 1:
+                code_msg = f"{code_msg} (x{count})"
+            reporting.capture_message(message, code_msg, level)
+
     def should_continue_asset_download(self, asset_id):
         """Check for any user cancel presses."""
         if asset_id in self.vDownloadCancelled:
-            self.vDownloadCancelled.remove(asset_id)
+            # discard, a concurrent queue_download may have dropped it already
+            self.vDownloadCancelled.discard(asset_id)
             return False
         return True
 
@@ -2614,20 +3189,33 @@ class c_Toolbox:
 
         NOTE: The return value must not be ignored!
         """
-        if asset_id in self.vDownloadQueue.keys():
-            self.vDownloadQueue[asset_id]['download_size'] = download_size
-            self.refresh_ui()
+        if not self.vRunning:
+            # Addon got disabled or Blender quits, don't hold up pool threads.
+            return False
+        download = self.vDownloadQueue.get(asset_id)
+        if download is not None:
+            download['download_size'] = download_size
+            # No refresh_ui() per chunk, f_download_handler redraws
+            # periodically while downloads are queued.
+            self.vRedraw = 1
         return self.should_continue_asset_download(asset_id)
 
     def reset_asset_error(self, asset_id=None, asset_name=None):
         """Resets any prior errors for this asset, such as download issue."""
-        for err in self.ui_errors:
+        # Iterates a copy, removing while iterating would skip entries.
+        # The list itself is modified in place, as other threads may append
+        # errors meanwhile.
+        for err in list(self.ui_errors):
             if asset_id and err.asset_id == asset_id:
-                self.ui_errors.remove(err)
                 self.print_debug(0, "Reset error from id", err)
             elif asset_name and err.asset_name == asset_name:
-                self.ui_errors.remove(err)
                 self.print_debug(0, "Reset error from name", err)
+            else:
+                continue
+            try:
+                self.ui_errors.remove(err)
+            except ValueError:
+                pass  # Already removed by another thread
 
     # .........................................................................
     def _try_to_assign_non_color_space(self,
@@ -2645,13 +3233,20 @@ class c_Toolbox:
                             "NONE",
                             None
                             ]
+        # The available colorspaces only change with the OCIO config,
+        # so the name which worked last time will almost always work again.
+        colorspace_names = NON_COLOR_SPACES
+        if self._non_color_space_name is not None:
+            colorspace_names = [self._non_color_space_name] + NON_COLOR_SPACES
+
         found_color_space = False
-        for color_space_name in NON_COLOR_SPACES:
+        for color_space_name in colorspace_names:
             try:
                 node.image.colorspace_settings.name = color_space_name
             except TypeError:
                 continue
             found_color_space = True
+            self._non_color_space_name = color_space_name
             break
 
         if not found_color_space:
@@ -2689,8 +3284,9 @@ class c_Toolbox:
         # Ensure we are only using textures of the input size
         sized_textures = []
         for tex in vTextures:
-            match_object = re.search(r"_(\d+K)[_\.]", os.path.basename(tex))
-            is_highres = vSize == "HIRES" and "HIRES" in os.path.basename(tex)
+            basename = os.path.basename(tex)
+            match_object = SIZE_TOKEN_RE.search(basename)
+            is_highres = vSize == "HIRES" and "HIRES" in basename
             if match_object:
                 size = match_object.group(1)
                 if size == vSize:
@@ -2706,22 +3302,32 @@ class c_Toolbox:
             return None
         vTextures = sized_textures
 
-        if vReuse and vMName in bpy.data.materials.keys():
-            return bpy.data.materials[vMName]
+        if vReuse:
+            vExisting = bpy.data.materials.get(vMName)
+            if vExisting is not None:
+                return vExisting
 
-        vCurMats = [vM for vM in bpy.data.materials]
-
-        vMTexs = [vT for vT in vTextures if f_FName(vT).endswith("METALNESS")]
-        vSTexs = [vT for vT in vTextures if f_FName(vT).endswith("SPECULAR")]
-        vRTexs = [vT for vT in vTextures if vT not in vMTexs and vT not in vSTexs]
-        vOTexs = [vT for vT in vTextures if "OVERLAY" in f_FName(vT)]
-        vOnlyOverlay = False
+        vCurMatNames = {vM.name for vM in bpy.data.materials}
 
+        # Sort textures by workflow in a single pass
+        vMTexs = []
+        vSTexs = []
+        vRTexs = []
+        vOTexs = []
         has_col_or_alpha = False
         for vT in vTextures:
-            if "COL" in f_FName(vT) or "ALPHA" in f_FName(vT):
+            vFName = f_FName(vT)
+            if vFName.endswith("METALNESS"):
+                vMTexs.append(vT)
+            elif vFName.endswith("SPECULAR"):
+                vSTexs.append(vT)
+            else:
+                vRTexs.append(vT)
+            if "OVERLAY" in vFName:
+                vOTexs.append(vT)
+            if "COL" in vFName or "ALPHA" in vFName:
                 has_col_or_alpha = True
-                break
+        vOnlyOverlay = False
 
         if not has_col_or_alpha and len(vOTexs) > 0 and len(vOTexs) <= len(vTextures):
             # This is an overlay, not a full texture.
@@ -2746,18 +3352,17 @@ class c_Toolbox:
             return None
 
         # Pick the first variant
-        var_names = {}
+        var_candidates = {}
         for f in vTextures:
             basename = os.path.basename(f).upper()
             if "_VAR" not in basename:
                 continue
 
-            base, post = basename.split("_VAR")
-            this_map = base.split("_")[-1]
-            if not var_names.get(this_map):
-                var_names[this_map] = basename
-            elif var_names[this_map] > basename:
-                var_names[this_map] = basename
+            base = basename.split("_VAR", 1)[0]
+            this_map = base.rpartition("_")[2]
+            var_candidates.setdefault(this_map, []).append(basename)
+        var_names = {this_map: min(basenames)
+                     for this_map, basenames in var_candidates.items()}
 
         self.print_debug(dbg, "=" * 100)
 
@@ -2765,29 +3370,26 @@ class c_Toolbox:
         self.print_debug(dbg, "Size : " + vSize)
         self.print_debug(dbg, "Textures :")
 
+        # Maps disabled in the settings, any texture tagged with one is skipped
+        skip_maps = set()
+        if not self.vSettings["use_ao"]:
+            skip_maps.add("AO")
+        if not self.vSettings["use_bump"]:
+            skip_maps |= BUMP_MAPS
+        if not self.vSettings["use_disp"]:
+            skip_maps |= DISP_MAPS
+        if not self.vSettings["use_16"]:
+            skip_maps |= MAPS_16BIT
+
         vTexs = {}
         for vF in vTextures:
             basename = os.path.basename(vF)
             vSplit = f_FName(vF).split("_")
             if vSplit[-1] in ["SPECULAR", "METALNESS"]:
                 vSplit[-1] = None
+            vSplitSet = set(vSplit)
 
-            if "AO" in vSplit and not self.vSettings["use_ao"]:
-                continue
-            if (
-                any(vS for vS in ["BUMP", "BUMP16"] if vS in vSplit)
-                and not self.vSettings["use_bump"]
-            ):
-                continue
-            if (
-                any(vS for vS in ["DISP", "DISP16"] if vS in vSplit)
-                and not self.vSettings["use_disp"]
-            ):
-                continue
-            if (
-                any(vS for vS in ["DISP16", "BUMP16", "NRM16"] if vS in vSplit)
-                and not self.vSettings["use_16"]
-            ):
+            if not vSplitSet.isdisjoint(skip_maps):
                 continue
             if vLOD != None:
                 if "LOD" in basename and vLOD not in basename:
@@ -2798,7 +3400,7 @@ class c_Toolbox:
             # Detect if this is a non-preferred variant and skip if so.
             skip_var = False
             for mtype in var_names.keys():
-                if mtype in vSplit:
+                if mtype in vSplitSet:
                     if not var_names.get(mtype):
                         continue
                     elif var_names[mtype] != basename.upper():
@@ -2807,9 +3409,12 @@ class c_Toolbox:
             if skip_var:
                 continue
 
-            vMap = [vT for vT in self.vMaps if vT in vSplit]
-            if len(vMap) and vSize in vSplit + ["PREVIEW"]:
-                vTexs[vMap[0]] = vF
+            if vSize not in vSplitSet and vSize != "PREVIEW":
+                continue
+            # First map in vMaps order wins, if a file has several tags
+            vMap = next((vT for vT in self.vMaps if vT in vSplitSet), None)
+            if vMap is not None:
+                vTexs[vMap] = vF
 
                 self.print_debug(dbg, " " + basename)
 
@@ -2839,33 +3444,34 @@ class c_Toolbox:
         vFabricGroup = None
         vMixerGroup = None
 
-        for vN in list(bpy.data.node_groups):
+        # Only reads here, no need to copy the collection
+        for vN in bpy.data.node_groups:
             if "UberMapping" in vN.name:
-                if "Aspect Ratio" in [vI.name for vI in vN.inputs]:
+                if _has_input(vN, "Aspect Ratio"):
                     vUberGroup = vN
             elif "Adjustments" in vN.name:
-                if "Hue Adj." in [vI.name for vI in vN.inputs]:
+                if _has_input(vN, "Hue Adj."):
                     vAdjustGroup = vN
             elif "Fabric" in vN.name:
-                if "Falloff" in [vI.name for vI in vN.inputs]:
+                if _has_input(vN, "Falloff"):
                     vFabricGroup = vN
             elif "Mixer" in vN.name:
-                if "Mix Texture Value" in [vI.name for vI in vN.inputs]:
+                if _has_input(vN, "Mix Texture Value"):
                     vMixerGroup = vN
 
         with bpy.data.libraries.load(vTemplate, link=False) as (vFrom, vTo):
             vTo.materials = vFrom.materials
 
         # Rename Poliigon node groups to be hidden (SOFT-543)
-        for vN in list(bpy.data.node_groups):
-            if vN.name == "simple_uv_mapping":
-                vN.name = ".simple_uv_mapping"
-            elif vN.name == "Poliigon_Fabric_Falloff":
-                vN.name = ".Poliigon_Fabric_Falloff"
-            elif vN.name == "Poliigon_Adjustments":
-                vN.name = ".Poliigon_Adjustments"
-
-        vMat = [vM for vM in bpy.data.materials if vM not in vCurMats][0]
+        for vGroupName in ("simple_uv_mapping",
+                           "Poliigon_Fabric_Falloff",
+                           "Poliigon_Adjustments"):
+            vN = bpy.data.node_groups.get(vGroupName)
+            if vN is not None:
+                vN.name = "." + vGroupName
+
+        vMat = [vM for vM in bpy.data.materials
+                if vM.name not in vCurMatNames][0]
         vMat.name = vMName
 
         vMat.poliigon = vType + ";" + vAsset
@@ -2873,19 +3479,19 @@ class c_Toolbox:
         vMGroup = None
         for vN in vMat.node_tree.nodes:
             if vN.type == "BSDF_PRINCIPLED":
-                if "SSS" in vTexs.keys():
+                if "SSS" in vTexs:
                     vN.inputs["Subsurface"].default_value = 0.02
 
             elif vN.type == "GROUP":
-                if "Color Hue Adj." in [vI.name for vI in vN.inputs]:
+                if _has_input(vN, "Color Hue Adj."):
                     vMGroup = vN
-                elif "Mix Texture Value" in [vI.name for vI in vN.inputs]:
+                elif _has_input(vN, "Mix Texture Value"):
                     if vMixerGroup != None:
                         bpy.data.node_groups.remove(vN.node_tree)
                     vMat.node_tree.nodes.remove(vN)
 
             elif vN.type == "DISPLACEMENT":
-                if "DISP" not in vTexs.keys() and "DISP16" not in vTexs.keys():
+                if "DISP" not in vTexs and "DISP16" not in vTexs:
                     vMat.node_tree.nodes.remove(vN)
 
         vMGroup.name = vMGroup.label = vMGroup.node_tree.name = vMName
@@ -2910,7 +3516,7 @@ class c_Toolbox:
 
             # Remove overlay if there isn't any.
             elif vN.name == "Overlay":
-                if not any(vM in vTexs.keys() for vM in ["OVERLAY"]):
+                if not any(vM in vTexs for vM in ["OVERLAY"]):
                     vMNodes.remove(vN)
 
             elif vN.type == "TEX_IMAGE":
@@ -2924,20 +3530,20 @@ class c_Toolbox:
 
             # Remove Alpha Multiply Node if no Alpha maps found
             elif vN.name == "Alpha Multiply":
-                if not any(vM in vTexs.keys() for vM in ["ALPHAMASKED", "MASK"]):
+                if not any(vM in vTexs for vM in ["ALPHAMASKED", "MASK"]):
                     vMNodes.remove(vN)
 
             elif vN.type == "GROUP":
                 vName = vN.name
                 if "UberMapping" in vName:
-                    if "Aspect Ratio" in [vI.name for vI in vN.inputs]:
+                    if _has_input(vN, "Aspect Ratio"):
                         vMUberGroup = vN
                         if vUberGroup != None:
                             vOld = vN.node_tree
                             vN.node_tree = vUberGroup
                             bpy.data.node_groups.remove(vOld)
                 elif "Adjustments" in vName:
-                    if "Hue Adj." in [vI.name for vI in vN.inputs]:
+                    if _has_input(vN, "Hue Adj."):
                         vMAdjustGroup = vN
                         if vAdjustGroup != None:
                             vOld = vN.node_tree
@@ -2945,12 +3551,12 @@ class c_Toolbox:
                             bpy.data.node_groups.remove(vOld)
 
                     # Remove Alpha Multiply Node if no Alpha maps found
-                    if "Alpha" in [vI.name for vI in vN.inputs]:
-                        if not any(vM in vTexs.keys() for vM in ["ALPHAMASKED", "MASK"]):
+                    if _has_input(vN, "Alpha"):
+                        if not any(vM in vTexs for vM in ["ALPHAMASKED", "MASK"]):
                             vN.inputs["Alpha"].default_value = 1.0
 
                 elif "Fabric" in vName:
-                    if "Falloff" in [vI.name for vI in vN.inputs]:
+                    if _has_input(vN, "Falloff"):
                         if vAsset.startswith("Fabric"):
                             vMFabricGroup = vN
                             if vFabricGroup != None:
@@ -2960,14 +3566,16 @@ class c_Toolbox:
                         else:
                             vMNodes.remove(vN)
                 else:
-                    vNNodes = vN.node_tree.nodes
-                    vNTrees.append(vNNodes)
-                    for vN1 in vNNodes:
-                        if vN1.type == "TEX_IMAGE":
-                            vTexNodes.append(vN1)
+                    vNTrees.append(vN.node_tree.nodes)
+
+        # Texture nodes inside the nested groups come after the top level ones
+        vTexNodes = list(chain(
+            vTexNodes,
+            (vN for vN in chain.from_iterable(vNTrees[1:])
+             if vN.type == "TEX_IMAGE")))
 
         if vBumpMap != None:
-            if "BUMP" not in vTexs.keys() and "BUMP16" not in vTexs.keys():
+            if "BUMP" not in vTexs and "BUMP16" not in vTexs:
                 vMNodes.remove(vBumpMap)
 
                 if vNormalMap != None:
@@ -2978,18 +3586,24 @@ class c_Toolbox:
             else:
                 vMLinks.new(vBumpMap.outputs["Normal"], vMAdjustGroup.inputs["Normal"])
 
+        # Same for every texture, read once outside the loop
+        engine = bpy.context.scene.render.engine
+        has_normal = "NRM" in vTexs or "NRM16" in vTexs
+        # Images by map, as several texture nodes may share the same map
+        vImages = {}
+
         missing_colorspace = []
         for vN in vTexNodes:
             vMap = vN.name
             if vMap == "ALPHA":
-                if "MASK" in vTexs.keys():
+                if "MASK" in vTexs:
                     vMap = "MASK"
 
                     vMat.blend_method = "HASHED"
                     vMat.shadow_method = "CLIP"
 
             elif vMap == "COLOR":
-                if "ALPHAMASKED" in vTexs.keys():
+                if "ALPHAMASKED" in vTexs:
                     vMap = "ALPHAMASKED"
 
                     vMat.blend_method = "HASHED"
@@ -2999,23 +3613,23 @@ class c_Toolbox:
 
             elif vMap == "BUMP":
                 vMap = "BUMP"
-                if "BUMP16" in vTexs.keys():
+                if "BUMP16" in vTexs:
                     vMap = "BUMP16"
 
             elif vMap == "DISPLACEMENT":
                 vMap = "DISP"
-                if "DISP16" in vTexs.keys():
+                if "DISP16" in vTexs:
                     vMap = "DISP16"
 
             elif vMap == "NORMAL":
                 vMap = "NRM"
-                if "NRM16" in vTexs.keys():
+                if "NRM16" in vTexs:
                     vMap = "NRM16"
 
             elif vMap == "OVERLAY":
                 vMap = "OVERLAY"
 
-            if vMap in vTexs.keys():
+            if vMap in vTexs:
                 if vMap == "ROUGHNESS":
                     vMLinks.new(
                         vN.outputs["Color"], vMAdjustGroup.inputs["ROUGHNESS"])
@@ -3026,10 +3640,10 @@ class c_Toolbox:
                     vMLinks.new(
                         vN.outputs["Color"], vMAdjustGroup.inputs["COLOR"])
 
-                if vMap in ["DISP", "DISP16"]:
+                if vMap in DISP_MAPS:
                     if self.prefs.use_micro_displacements:
                         vMGroup.inputs["Displacement Strength"].default_value = 0.05
-                        if "NRM" or "NRM16" in vTexs.keys():
+                        if has_normal:
                             # Micro displacement does not work with normal and
                             # displacement maps at the same time, so disable
                             # normal (if displacement used).
@@ -3042,17 +3656,18 @@ class c_Toolbox:
                     else:
                         vMGroup.inputs["Displacement Strength"].default_value = 0.0
 
-                engine = bpy.context.scene.render.engine
                 if engine == "BLENDER_EEVEE" and vMap == "TRANSMISSION":
                     vMat.use_screen_refraction = True
                     vMat.refraction_depth = 1
 
-                vTName = f_FName(vTexs[vMap])
-                if vTName in bpy.data.images.keys():
-                    vImage = bpy.data.images[vTName]
-                else:
-                    vImage = bpy.data.images.load(vTexs[vMap])
-                    vImage.name = vTName
+                vImage = vImages.get(vMap)
+                if vImage is None:
+                    vTName = f_FName(vTexs[vMap])
+                    vImage = bpy.data.images.get(vTName)
+                    if vImage is None:
+                        vImage = bpy.data.images.load(vTexs[vMap])
+                        vImage.name = vTName
+                    vImages[vMap] = vImage
 
                 vN.image = vImage
                 if vMap in [
@@ -3263,125 +3878,63 @@ class c_Toolbox:
 
         for vType in self.vAssetTypes:
             self.vAssets["local"][vType] = {}
+        self._local_assets_changed()
+
+        vOldFolders = self._load_local_folders_cache()
+        vDirs = [self.vSettings["library"]] + self.vSettings["add_dirs"]
+        vDirs = [vDir for vDir in vDirs
+                 if vDir not in self.vSettings["disabled_dirs"]]
+        # Library directories may live on different drives,
+        # scanning them in parallel overlaps their disk latencies.
+        vFolders = {}
+        if len(vDirs) > 1:
+            vWorkers = min(MAX_SCAN_THREADS, len(vDirs))
+            with ThreadPoolExecutor(max_workers=vWorkers) as executor:
+                vFuts = [executor.submit(self._scan_local_folders,
+                                         vDir,
+                                         vOldFolders)
+                         for vDir in vDirs]
+            # Merged in order, a folder within several directories once
+            for vFut in vFuts:
+                for vPath, vFolder in vFut.result().items():
+                    vFolders.setdefault(vPath, vFolder)
+        elif vDirs:
+            vFolders = self._scan_local_folders(vDirs[0], vOldFolders)
+        self._save_local_folders_cache(vFolders)
 
         vGetAssets = {}
-        vModels = []
-        vHDRIs = []
-        vBrushes = []
+        vModels = set()
+        vHDRIs = set()
+        vBrushes = set()
 
-        vPrevs = {}
         gLatest = {}
-        for vDir in [self.vSettings["library"]] + self.vSettings["add_dirs"]:
-            if vDir in self.vSettings["disabled_dirs"]:
-                continue
-
-            for vPath, vDirs, vFiles in os.walk(vDir):
-                vPath = vPath.replace("\\", "/")
-
-                if "Software" in vPath and not "Blender" in vPath:
-                    continue
-
-                # Determine asset name as the common part of all filenames-
-                # E.g. "SomePie001_2K.png" and "SomePie_Berry.fbx"
-                # results in "SomePie" for vName
-                # TODO(Andreas): Have a unit test
-                name_candidates = []
-                for filename in vFiles:
-                    if filename.startswith("."):
-                        continue  # Ignore hidden system files like .DS_Store
-                    name, ext = f_FNameExt(filename)
-                    if ext in ["", ".zip"]:
-                        continue
-                    name_candidates.append(name.split("_")[0])
-                vName = os.path.commonprefix(name_candidates)
-
-                # In case above loop results in a "funny" name,
-                # we'll fall back to the old behavior
-                if len(vName) > 5:  # assuming no assets with only five chars
-                    use_name_per_file = False
-                else:
-                    use_name_per_file = True
-
-                for vF in vFiles:
-                    if vF.startswith("."):
-                        continue  # Ignore hidden system files like .DS_Store
-                    if f_FExt(vF) in ["", ".zip"]:
-                        continue
-
-                    vNamePerFile, vExt = f_FNameExt(vF)
-                    if use_name_per_file:
-                        vName = vNamePerFile
-
-                    if vName.startswith("Hdr"):
-                        vHDRIs.append(vName)
-
-                    elif vName.startswith("Brush"):
-                        vBrushes.append(vName)
-
-                    if any(
-                        f_FName(vF).lower().endswith(vS)
-                        for vS in [
-                            "_atlas",
-                            "_sphere",
-                            "_cylinder",
-                            "_fabric",
-                            "_preview1",
-                        ]
-                    ):
-                        if vName not in vGetAssets.keys():
-                            vGetAssets[vName] = []
-
-                        vGetAssets[vName].append(vPath + "/" + vF)
-
-                        vFTime = os.path.getctime(vPath + "/" + vF)
-                        vFDate = int(
-                            (
-                                str(datetime.datetime.fromtimestamp(vFTime)).split(" ")[
-                                    0
-                                ]
-                            ).replace("-", "")
-                        )
-
-                        if vName not in gLatest.keys():
-                            gLatest[vName] = vFTime
-                        elif gLatest[vName] < vFTime:
-                            gLatest[vName] = vFTime
-
-                    elif vExt.lower() in self.vTexExts:
-                        anymap = any(vM in vF for vM in self.vMaps)
-                        if anymap or "Backdrop" in vF:
-                            if vName not in vGetAssets.keys():
-                                vGetAssets[vName] = []
-
-                            vGetAssets[vName].append(vPath + "/" + vF)
-
-                    elif vExt.lower() in self.vModExts:
-                        if vName not in vGetAssets.keys():
-                            vGetAssets[vName] = []
-
-                        vGetAssets[vName].append(vPath + "/" + vF)
-
-                        vGetAssets[vName] += [
-                            vPath + "/" + vFl
-                            for vFl in vFiles
-                            if f_FExt(vFl) in self.vTexExts
-                        ]
-
-                        if vName not in vModels:
-                            vModels.append(vName)
-
-        for vA in sorted(list(vGetAssets.keys())):
+        # {file path: ctime}, reused by build_local_asset_data.
+        vCTimes = {}
+        for vFolder in vFolders.values():
+            vScan = vFolder["scan"]
+            vModels.update(vScan["models"])
+            vHDRIs.update(vScan["hdris"])
+            vBrushes.update(vScan["brushes"])
+
+            for vName, vFile, vFTime, vIsPreview in vScan["files"]:
+                vGetAssets.setdefault(vName, []).append(vFile)
+                vCTimes[vFile] = vFTime
+
+                if vIsPreview and vFTime > gLatest.get(vName, 0):
+                    gLatest[vName] = vFTime
+
+        for vA in sorted(vGetAssets):
             if any(vS in vA for vS in self.vModSecondaries):
                 vPrnt = vA
                 for vS in self.vModSecondaries:
                     vPrnt = vPrnt.replace(vS, "")
 
-                if vPrnt in list(vGetAssets.keys()):
+                if vPrnt in vGetAssets:
                     vGetAssets[vPrnt] += vGetAssets[vA]
 
                     del vGetAssets[vA]
 
-        for vA in sorted(list(vGetAssets.keys())):
+        for vA in sorted(vGetAssets):
             vType = "Textures"
             if vA in vModels:
                 vType = "Models"
@@ -3390,17 +3943,17 @@ class c_Toolbox:
             elif vA in vBrushes:
                 vType = "Brushes"
 
-            if vType not in self.vAssets["local"].keys():
-                self.vAssets["local"][vType] = {}
-
             # updating the global asset dict here for better UI responsiveness
-            self.vAssets["local"][vType][vA] = self.build_local_asset_data(vA, vType, vGetAssets[vA])
+            local_assets = self.vAssets["local"].setdefault(vType, {})
+            local_assets[vA] = self.build_local_asset_data(
+                vA, vType, vGetAssets[vA], vCTimes)
+            self._local_assets_changed()
 
         vSLatest = {}
-        for vK in gLatest.keys():
-            vSLatest[gLatest[vK]] = vK
+        for vK, vFTime in gLatest.items():
+            vSLatest[vFTime] = vK
 
-        gLatest = [vSLatest[vK] for vK in reversed(sorted(vSLatest.keys()))]
+        gLatest = [vSLatest[vK] for vK in sorted(vSLatest, reverse=True)]
 
         # Need to tag redraw, can't directlly call refresh_ui since
         # this runs on startup.
@@ -3413,52 +3966,205 @@ class c_Toolbox:
             self.vRerunGetLocalAssets = False
             self.f_GetLocalAssets()
 
-    def build_local_asset_data(self, asset, type, files):
-        """Builds data dict for asset"""
-        files = sorted(list(set(files)))
+    def _scan_local_folders(self, vDir, vOldFolders):
+        """Returns {folder path: scan} for vDir and all its subfolders.
 
-        maps = []
-        lods = []
-        sizes = []
-        vars = []
+        Folders with an unchanged modification time reuse their former
+        result from vOldFolders, without listing or stat'ing their files.
+        Note: In-place changes of a file's content don't change the folder's
+        modification time, thus an asset's date may lag behind in this case.
+        Only reads vOldFolders, can run in parallel for several directories.
+        """
+        vFolders = {}
+        vStack = [vDir]
+        while vStack:
+            vPath = vStack.pop()
+            if vPath in vFolders:
+                continue  # E.g. an additional directory inside the library
+            try:
+                # Taken before listing, so a change while listing shows up
+                # as a modified folder on the next scan.
+                vMTime = os.stat(vPath).st_mtime_ns
+            except OSError:
+                continue
+
+            vFolder = vOldFolders.get(vPath)
+            if vFolder is None or vFolder["mtime"] != vMTime:
+                try:
+                    vEntries, vSubdirs = self._list_dir(vPath)
+                except OSError:
+                    continue  # Like os.walk, skip folders which can't be read.
+                vFolder = {
+                    "mtime": vMTime,
+                    "subdirs": vSubdirs,
+                    "scan": self._scan_local_folder(vPath, vEntries),
+                }
+            vFolders[vPath] = vFolder
+            vStack.extend(vFolder["subdirs"])
+        return vFolders
+
+    def _scan_local_folder(self, vPath, vEntries):
+        """Returns the asset files found in a single folder.
+
+        Result is a JSON serializable dict with keys:
+        "files": List of [asset name, file path, ctime, is preview]
+        "models", "hdris", "brushes": Asset names identified as such
+        """
+        vPath = vPath.replace("\\", "/")
+
+        vFiles = []
+        vModels = set()
+        vHDRIs = set()
+        vBrushes = set()
+        vScan = {"files": vFiles, "models": [], "hdris": [], "brushes": []}
+
+        if "Software" in vPath and not "Blender" in vPath:
+            return vScan
+
+        def add_file(vName, vEntry, vIsPreview=False):
+            vFTime = vEntry.stat().st_ctime
+            vFile = vPath + "/" + vEntry.name
+            vFiles.append([vName, vFile, vFTime, vIsPreview])
+
+        # Split each filename once, as (entry, name, lower case extension)
+        vCandidates = []
+        for vEntry in vEntries:
+            if vEntry.name.startswith("."):
+                continue  # Ignore hidden system files like .DS_Store
+            name, ext = f_FNameExt(vEntry.name)
+            if ext in ["", ".zip"]:
+                continue
+            vCandidates.append((vEntry, name, ext))
+
+        # Determine asset name as the common part of all filenames-
+        # E.g. "SomePie001_2K.png" and "SomePie_Berry.fbx"
+        # results in "SomePie" for vName
+        # TODO(Andreas): Have a unit test
+        name_candidates = [name.split("_")[0] for _, name, _ in vCandidates]
+        vName = os.path.commonprefix(name_candidates)
+
+        # In case above loop results in a "funny" name,
+        # we'll fall back to the old behavior
+        if len(vName) > 5:  # assuming no assets with only five chars
+            use_name_per_file = False
+        else:
+            use_name_per_file = True
+
+        vTexEntries = None  # Image files in this folder, once needed
+        for vEntry, vNamePerFile, vExt in vCandidates:
+            vF = vEntry.name
+            if use_name_per_file:
+                vName = vNamePerFile
+
+            if vName.startswith("Hdr"):
+                vHDRIs.add(vName)
+
+            elif vName.startswith("Brush"):
+                vBrushes.add(vName)
+
+            if vNamePerFile.lower().endswith(PREVIEW_SUFFIXES):
+                add_file(vName, vEntry, vIsPreview=True)
+
+            elif vExt in self.vTexExts:
+                if LOCAL_TEX_RE.search(vF):
+                    add_file(vName, vEntry)
+
+            elif vExt in self.vModExts:
+                add_file(vName, vEntry)
+
+                # All textures in the folder belong to the model,
+                # added once per model asset, not once per model file.
+                if vName not in vModels:
+                    if vTexEntries is None:
+                        vTexEntries = [
+                            vEntryTex for vEntryTex in vEntries
+                            if f_FExt(vEntryTex.name) in self.vTexExts
+                        ]
+                    for vEntryTex in vTexEntries:
+                        add_file(vName, vEntryTex)
+
+                vModels.add(vName)
+
+        vScan["models"] = sorted(vModels)
+        vScan["hdris"] = sorted(vHDRIs)
+        vScan["brushes"] = sorted(vBrushes)
+        return vScan
+
+    def _load_local_folders_cache(self):
+        """Returns the folder scans of the last library scan.
+
+        Read from disk on first use, to speed up the first scan after start.
+        """
+        if self._local_folders is not None:
+            return self._local_folders
+
+        vCacheFile = self.gSettingsDir + "/Poliigon_Local_Assets.json"
+        try:
+            with open(vCacheFile, "r") as vFile:
+                vData = json.load(vFile)
+        except (OSError, ValueError):
+            return {}
+        # Scan results depend on the addon's map and extension lists
+        if vData.get("version") != self.version:
+            return {}
+        self._local_folders = vData.get("folders", {})
+        return self._local_folders
+
+    def _save_local_folders_cache(self, vFolders):
+        """Stores the folder scans for the next scan, if they changed."""
+        if vFolders == self._local_folders:
+            return
+        self._local_folders = vFolders
+
+        vCacheFile = self.gSettingsDir + "/Poliigon_Local_Assets.json"
+        vData = {"version": self.version, "folders": vFolders}
+        try:
+            write_file_atomic(
+                vCacheFile, json.dumps(vData, separators=(",", ":")))
+        except OSError as e:
+            self.print_debug(0, "_save_local_folders_cache", "ERROR", e)
+
+    def build_local_asset_data(self, asset, type, files, ctimes=None):
+        """Builds data dict for asset.
+
+        ctimes optionally maps file paths to their already known ctime,
+        files not in there get stat'ed.
+        """
+        if ctimes is None:
+            ctimes = {}
+        files = sorted(set(files))
+
+        maps = set()
+        lods = set()
+        sizes = set()
+        vars = set()
         preview = None
         for file in files:
-            if any(
-                f_FName(file).lower().endswith(string)
-                for string in [
-                    "_atlas",
-                    "_sphere",
-                    "_cylinder",
-                    "_fabric",
-                    "_preview1",
-                ]
-            ):
+            filename, filename_ext = f_FNameExt(file)
+            if filename.lower().endswith(PREVIEW_SUFFIXES):
                 preview = file
             else:
-                filename_parts = f_FName(file).split("_")
-                filename_ext = f_FExt(file)
+                filename_parts = frozenset(filename.split("_"))
                 is_model = filename_ext == '.fbx' or filename_ext == '.blend'
-                maps += [map for map in self.vMaps if map in filename_parts]
-                lods += [
-                    lod for lod in self.vLODs
-                    if lod in filename_parts and is_model
-                ]
-                sizes += [
-                    size for size in self.vSizes
-                    if size in filename_parts
-                ]
-                vars += [var for var in self.vVars if var in filename_parts]
+                maps |= MAPS_SET & filename_parts
+                if is_model:
+                    lods |= LODS_SET & filename_parts
+                sizes |= SIZES_SET & filename_parts
+                vars |= VARS_SET & filename_parts
 
         asset_data = {}
         asset_data["name"] = asset
         # asset_data["id"] = 0  # Don't populate id, it's not available here.
         asset_data["type"] = type
         asset_data["files"] = files
-        asset_data["maps"] = sorted(list(set(maps)))
+        asset_data["maps"] = sorted(maps)
         asset_data["lods"] = [lod for lod in self.vLODs if lod in lods]  #sort
         asset_data["sizes"] = [size for size in self.vSizes if size in sizes]  #sort
-        asset_data["vars"] = sorted(list(set(vars)))
-        modified_times = [os.path.getctime(file) for file in files]
+        asset_data["vars"] = sorted(vars)
+        modified_times = [
+            ctimes[file] if file in ctimes else os.path.getctime(file)
+            for file in files
+        ]
         if modified_times:
             asset_data["date"] = max(modified_times)
         else:
@@ -3485,11 +4191,9 @@ class c_Toolbox:
                 if vType == "Textures" and vAsset != "":
                     self.print_debug(dbg, "f_GetSceneAssets", vAsset)
 
-                    if vAsset not in vImportedAssets["Textures"].keys():
-                        vImportedAssets["Textures"][vAsset] = []
-
-                    if vM not in vImportedAssets["Textures"][vAsset]:
-                        vImportedAssets["Textures"][vAsset].append(vM)
+                    vEntities = vImportedAssets["Textures"].setdefault(vAsset, [])
+                    if vM not in vEntities:
+                        vEntities.append(vM)
             except:
                 pass
 
@@ -3500,11 +4204,9 @@ class c_Toolbox:
                 if vType == "Models" and vAsset != "":
                     self.print_debug(dbg, "f_GetSceneAssets", vAsset)
 
-                    if vAsset not in vImportedAssets["Models"].keys():
-                        vImportedAssets["Models"][vAsset] = []
-
-                    if vO not in vImportedAssets["Models"][vAsset]:
-                        vImportedAssets["Models"][vAsset].append(vO)
+                    vEntities = vImportedAssets["Models"].setdefault(vAsset, [])
+                    if vO not in vEntities:
+                        vEntities.append(vO)
             except:
                 pass
 
@@ -3515,14 +4217,15 @@ class c_Toolbox:
                 if vType in ["HDRIs", "Brushes"] and vAsset != "":
                     self.print_debug(dbg, "f_GetSceneAssets", vAsset)
 
-                    if vAsset not in vImportedAssets[vType].keys():
-                        vImportedAssets[vType][vAsset] = []
-
-                    vImportedAssets[vType][vAsset].append(vI)
+                    vImportedAssets[vType].setdefault(vAsset, []).append(vI)
             except:
                 pass
 
         self.imported_assets = vImportedAssets
+        self.imported_names_lc = {
+            vType: [(vA.lower(), vA) for vA in vAssets]
+            for vType, vAssets in vImportedAssets.items()}
+        self._local_assets_changed()
 
     def f_GetActiveData(self):
         dbg = 0
@@ -3542,7 +4245,7 @@ class c_Toolbox:
             vMLinks = vMat.node_tree.links
             for vN in vMNodes:
                 if vN.type == "GROUP":
-                    if "Mix Texture Value" in [vI.name for vI in vN.inputs]:
+                    if _has_input(vN, "Mix Texture Value"):
                         vMat1 = None
                         vMat2 = None
                         vMixTex = None
@@ -3648,20 +4351,22 @@ class c_Toolbox:
             return
         self.vTimer = time.time()
 
-        vAssetNames = []
-        for vType in self.vAssets["my_assets"].keys():
-            vAssetNames += self.vAssets["my_assets"][vType]
+        vAssetNames = set()
+        for vAssets in list(self.vAssets["my_assets"].values()):
+            vAssetNames.update(vAssets)
 
         self.print_debug(dbg, "f_CheckAssets", "New Assets :")
 
         vZips = []
+        vZipsSeen = set()
         self.vNewAssets = []
         for vDir in [self.vSettings["library"]] + self.vSettings["add_dirs"]:
             for vPath, vDirs, vFiles in os.walk(vDir):
                 vPath = vPath.replace("\\", "/")
                 for vF in vFiles:
                     if vF.endswith(".zip"):
-                        if vPath + vF not in vZips:
+                        if vPath + vF not in vZipsSeen:
+                            vZipsSeen.add(vPath + vF)
                             vZips.append(vPath + vF)
 
                     elif "COL" in vF or vF.startswith("Back"):
@@ -3681,9 +4386,9 @@ class c_Toolbox:
                 self.print_debug(dbg, "f_CheckAssets", "-", vName, " from ", vZFile)
 
                 gLatest = 0
-                for vType in self.vAssets["local"].keys():
-                    if vName in self.vAssets["local"][vType].keys():
-                        for vF in self.vAssets["local"][vType][vName]["files"]:
+                for vLocalAssets in list(self.vAssets["local"].values()):
+                    if vName in vLocalAssets:
+                        for vF in vLocalAssets[vName]["files"]:
                             try:
                                 vFDate = datetime.datetime.fromtimestamp(
                                     os.path.getctime(vF)
@@ -3814,8 +4519,8 @@ class c_Toolbox:
             #     self.vPreviews[vAsset].image_size[:])
             return self.vPreviews[vAsset].icon_id
 
-        f_MDir(self.gOnlinePreviews)
-
+        # No f_MDir here, this runs on every draw and the folder gets
+        # ensured by f_DownloadPreview before writing to it.
         vPrev = self.f_GetThumbnailPath(vAsset, index)
 
         if os.path.exists(vPrev):
@@ -3828,9 +4533,12 @@ class c_Toolbox:
 
             return self.vPreviews[vAsset].icon_id
 
-        if vAsset not in self.vPreviewsDownloading:
-            self.vPreviewsDownloading.append(vAsset)
-            self.f_QueuePreview(vAsset, index)
+        # Test and add under lock, so a preview never gets queued twice
+        with self._preview_lock:
+            if vAsset in self.vPreviewsDownloading:
+                return None
+            self.vPreviewsDownloading.add(vAsset)
+        self.f_QueuePreview(vAsset, index)
 
         return None
 
@@ -3999,7 +4707,7 @@ class c_Toolbox:
         errors caused by only paritally reloaded modules.
         """
         rst_id = "RESTART_POST_UPDATE"
-        if rst_id in [ntc.notification_id for ntc in self.notifications]:
+        if any(ntc.notification_id == rst_id for ntc in self.notifications):
             # Already registered.
             return
         notice = Notification(
@@ -4038,9 +4746,9 @@ class c_Toolbox:
             "NO_INTERNET_CONNECTION"
         ]
         if status_name == api.ApiStatus.CONNECTION_OK:
-            for existing in self.notifications:
-                if existing.notification_id in reset_ids:
-                    self.notifications.remove(existing)
+            self.notifications = [
+                existing for existing in self.notifications
+                if existing.notification_id not in reset_ids]
 
         elif status_name == api.ApiStatus.NO_INTERNET:
             notice = build_no_internet_notification()
@@ -4127,10 +4835,7 @@ def f_tick_handler() -> int:
     if cTB.vRunning:  # and not self.vExit
         cTB.vExit = 0
 
-        # Thread cleanup.
-        for vT in list(cTB.vThreads):
-            if not vT.is_alive():
-                cTB.vThreads.remove(vT)
+        cTB.reap_threads()
 
         # Updater callback.
         if cTB.prefs and cTB.prefs.auto_check_update:
@@ -4146,8 +4851,7 @@ def f_download_handler() -> int:
     The returned value signifies how long until the next execution.
     """
     next_call_s = 1
-    combined_keys = list(cTB.vDownloadQueue.keys()) + list(cTB.vQuickPreviewQueue.keys())
-    if len(combined_keys) or cTB.vRedraw:
+    if cTB.vDownloadQueue or cTB.vQuickPreviewQueue or cTB.vRedraw:
         cTB.vRedraw = 0
         next_call_s = 0.1
         cTB.refresh_ui()
@@ -4263,6 +4967,8 @@ cTB = c_Toolbox()
 def blender_quitting():
     global cTB
     cTB.vRunning = 0
+    if cTB._save_timer is not None:
+        cTB.flush_settings_now()
 
 
 def register(bl_info):
@@ -4292,6 +4998,11 @@ def unregister():
         bpy.app.handlers.load_post.remove(f_load_handler)
 
     cTB.vRunning = 0
+    cTB.shutdown_pools()
+    if cTB._save_timer is not None:
+        cTB.flush_settings_now()
+    if cTB._error_report_timer is not None:
+        cTB.flush_error_reports_now()
 
     # Don't block unregister or closing blender.
     # for vT in cTB.vThreads:
@@ -4303,9 +5014,11 @@ def unregister():
     except KeyError:
         pass
 
-    cTB.vPreviews.clear()
+    if cTB._previews is not None:
+        cTB._previews.clear()
 
-    try:
-        bpy.utils.previews.remove(cTB.vPreviews)
-    except KeyError:
-        pass
+        try:
+            bpy.utils.previews.remove(cTB._previews)
+        except KeyError:
+            pass
+        cTB._previews = None
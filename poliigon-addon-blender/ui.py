@@ -63,6 +63,9 @@ def f_BuildUI(vUI, vContext):
 
     cTB.vBtns = []
 
+    # Sample the ui scale once per draw, get_ui_scale() returns this value.
+    cTB.check_dpi()
+
     for vA in bpy.context.screen.areas:
         if vA.type == "VIEW_3D":
             for vR in vA.regions:
@@ -83,7 +86,6 @@ def f_BuildUI(vUI, vContext):
                         vWidth = 1
                     if vWidth != cTB.vWidth:
                         cTB.vWidth = vWidth
-                        cTB.check_dpi()
 
     vSpc = 1.0 / cTB.vWidth
 
@@ -1188,8 +1190,7 @@ def f_BuildAssets(cTB):
                     scale=thumb_scale
                 )
 
-                if vAData["name"] in cTB.vPreviewsDownloading:
-                    cTB.vPreviewsDownloading.remove(vAData["name"])
+                cTB.vPreviewsDownloading.discard(vAData["name"])
 
             else:
                 if vAData["name"] in cTB.vPreviewsDownloading:
@@ -3140,13 +3141,214 @@ def f_AssetInfo(cTB, vAsset):
     bpy.context.window_manager.popover(asset_info_draw, ui_units_x=15)
 
 
+def _build_notice_mode(url, action, notification_id):
+    return "notify@{}@{}@{}".format(url, action, notification_id)
+
+
+def _draw_notice_open_url(notice: Notification,
+                          first_row: bpy.types.UILayout,
+                          main_col: bpy.types.UILayout,
+                          panel_width: float) -> None:
+    """Draws a notice with a button opening an url."""
+    # Empirical for width for "Beta addon: [Take survey]" specifically.
+    single_row_width = 250
+    if panel_width > single_row_width:
+        # Single row with text + button.
+        # TODO: generalize this for notification message and length,
+        # and if dismiss is included.
+        first_row.alert = True
+        first_row.label(text=notice.title)
+        first_row.alert = False
+        ops = first_row.operator(
+            "poliigon.poliigon_link",
+            icon=notice.icon or "NONE",
+            text=notice.ac_open_url_label,
+        )
+        if notice.tooltip:
+            ops.vTooltip = notice.tooltip
+        ops.vMode = _build_notice_mode(
+            notice.ac_open_url_address,
+            notice.ac_open_url_label,
+            notice.notification_id)
+
+    else:
+        # Two rows (or more, if text wrapping).
+        col = first_row.column(align=True)
+        col.alert = True
+        # Empirically found squaring below worked best for 1 & 2x displays,
+        # which accounts for the box+panel padding and the 'x' button.
+        if notice.allow_dismiss:
+            padding_width = 32 * cTB.get_ui_scale()
+        else:
+            padding_width = 17 * cTB.get_ui_scale()
+        cTB.f_Label(cTB.vWidth - padding_width, notice.title, col)
+        col.alert = False
+
+        second_row = main_col.row(align=True)
+        second_row.scale_y = 1.0
+        ops = second_row.operator(
+            "poliigon.poliigon_link",
+            icon=notice.icon or "NONE",
+            text=notice.ac_open_url_label,
+        )
+        if notice.tooltip:
+            ops.vTooltip = notice.tooltip
+        ops.vMode = _build_notice_mode(
+            notice.ac_open_url_address,
+            notice.ac_open_url_label,
+            notice.notification_id)
+
+
+def _draw_notice_update_ready(notice: Notification,
+                              first_row: bpy.types.UILayout,
+                              main_col: bpy.types.UILayout,
+                              panel_width: float) -> None:
+    """Draws a notice with download and logs buttons of an update."""
+    # Empirical for width for "Update ready: Download | logs".
+    single_row_width = 300
+    if panel_width > single_row_width:
+        # Single row with text + button.
+        first_row.alert = True
+        first_row.label(text=notice.title)
+        first_row.alert = False
+        splitrow = first_row.split(factor=0.7, align=True)
+        splitcol = splitrow.split(align=True)
+
+        ops = splitcol.operator(
+            "poliigon.poliigon_link",
+            icon=notice.icon or "NONE",
+            text=str(notice.ac_update_ready_download_label),
+        )
+        if notice.tooltip:
+            ops.vTooltip = notice.tooltip
+        ops.vMode = _build_notice_mode(
+            notice.ac_update_ready_download_url,
+            notice.ac_update_ready_download_label,
+            notice.notification_id)
+
+        splitcol = splitrow.split(align=True)
+        ops = splitcol.operator(
+            "poliigon.poliigon_link",
+            text=str(notice.ac_update_ready_logs_label),
+        )
+        if notice.tooltip:
+            ops.vTooltip = "See changes in this version"
+        ops.vMode = _build_notice_mode(
+            notice.ac_update_ready_logs_url,
+            notice.ac_update_ready_logs_label,
+            notice.notification_id)
+    else:
+        # Two rows (or more, if text wrapping).
+        col = first_row.column(align=True)
+        col.alert = True
+        if notice.allow_dismiss:
+            padding_width = 32 * cTB.get_ui_scale()
+        else:
+            padding_width = 17 * cTB.get_ui_scale()
+        cTB.f_Label(cTB.vWidth - padding_width, notice.title, col)
+        col.alert = False
+
+        second_row = main_col.row(align=True)
+        splitrow = second_row.split(factor=0.7, align=True)
+        splitcol = splitrow.split(align=True)
+        ops = splitcol.operator(
+            "poliigon.poliigon_link",
+            icon=notice.icon or "NONE",
+            text=str(notice.ac_update_ready_download_label),
+        )
+        if notice.tooltip:
+            ops.vTooltip = notice.tooltip
+        ops.vMode = _build_notice_mode(
+            notice.ac_update_ready_download_url,
+            notice.ac_update_ready_download_label,
+            notice.notification_id)
+        splitcol = splitrow.split(align=True)
+        ops = splitcol.operator(
+            "poliigon.poliigon_link",
+            text=str(notice.ac_update_ready_logs_label),
+        )
+        if notice.tooltip:
+            ops.vTooltip = notice.tooltip
+        ops.vMode = _build_notice_mode(
+            notice.ac_update_ready_logs_url,
+            notice.ac_update_ready_logs_label,
+            notice.notification_id)
+
+
+def _draw_notice_popup_message(notice: Notification,
+                               first_row: bpy.types.UILayout,
+                               main_col: bpy.types.UILayout,
+                               panel_width: float) -> None:
+    """Draws a notice with a button opening a popup message."""
+    single_row_width = 250
+    if panel_width > single_row_width:
+        # Single row with text + button.
+        first_row.alert = True
+        first_row.label(text=notice.title)
+        first_row.alert = False
+        ops = first_row.operator(
+            "poliigon.popup_message",
+            icon=notice.icon or "NONE",
+            text="View"
+        )
+
+    else:
+        # Two rows (or more, if text wrapping).
+        col = first_row.column(align=True)
+        col.alert = True
+        # Empirically found squaring below worked best for 1 & 2x displays,
+        # which accounts for the box+panel padding and the 'x' button.
+        if notice.allow_dismiss:
+            padding_width = 32 * cTB.get_ui_scale()
+        else:
+            padding_width = 17 * cTB.get_ui_scale()
+        cTB.f_Label(cTB.vWidth - padding_width, notice.title, col)
+        col.alert = False
+
+        second_row = main_col.row(align=True)
+        second_row.scale_y = 1.0
+        ops = second_row.operator(
+            "poliigon.popup_message",
+            icon=notice.icon or "NONE",
+            text="View",
+        )
+
+    ops.message_body = notice.ac_popup_message_body
+    ops.notice_id = notice.notification_id
+    if notice.tooltip:
+        ops.vTooltip = notice.tooltip
+    if notice.ac_popup_message_url:
+        ops.message_url = notice.ac_popup_message_url
+
+
+def _draw_notice_run_operator(notice: Notification,
+                              first_row: bpy.types.UILayout,
+                              main_col: bpy.types.UILayout,
+                              panel_width: float) -> None:
+    """Draws a notice as a single button running an operator."""
+    # Single row with only a button.
+    ops = first_row.operator(
+        "poliigon.notice_operator",
+        text=notice.title,
+        icon=notice.icon or "NONE",
+    )
+    ops.notice_id = notice.notification_id
+    ops.ops_name = notice.ac_run_operator_ops_name
+    ops.vTooltip = notice.tooltip
+
+
+# Draw function per notification action type, used by f_NotificationBanner.
+NOTICE_DRAW_FUNCS = {
+    Notification.ActionType.OPEN_URL: _draw_notice_open_url,
+    Notification.ActionType.UPDATE_READY: _draw_notice_update_ready,
+    Notification.ActionType.POPUP_MESSAGE: _draw_notice_popup_message,
+    Notification.ActionType.RUN_OPERATOR: _draw_notice_run_operator,
+}
+
+
 @reporting.handle_draw()
 def f_NotificationBanner(notifications, layout):
     """General purpose notification banner UI draw element."""
-
-    def build_mode(url, action, notification_id):
-        return "notify@{}@{}@{}".format(url, action, notification_id)
-
     if not notifications:
         return
 
@@ -3160,178 +3362,9 @@ def f_NotificationBanner(notifications, layout):
         first_row = main_col.row(align=False)
         x_row = first_row  # x_row is the row to add the x button to, if there.
 
-        if notice.action == Notification.ActionType.OPEN_URL:
-            # Empirical for width for "Beta addon: [Take survey]" specifically.
-            single_row_width = 250
-            if panel_width > single_row_width:
-                # Single row with text + button.
-                # TODO: generalize this for notification message and length,
-                # and if dismiss is included.
-                first_row.alert = True
-                first_row.label(text=notice.title)
-                first_row.alert = False
-                ops = first_row.operator(
-                    "poliigon.poliigon_link",
-                    icon=notice.icon or "NONE",
-                    text=notice.ac_open_url_label,
-                )
-                if notice.tooltip:
-                    ops.vTooltip = notice.tooltip
-                ops.vMode = build_mode(
-                    notice.ac_open_url_address,
-                    notice.ac_open_url_label,
-                    notice.notification_id)
-
-            else:
-                # Two rows (or more, if text wrapping).
-                col = first_row.column(align=True)
-                col.alert = True
-                # Empirically found squaring below worked best for 1 & 2x displays,
-                # which accounts for the box+panel padding and the 'x' button.
-                if notice.allow_dismiss:
-                    padding_width = 32 * cTB.get_ui_scale()
-                else:
-                    padding_width = 17 * cTB.get_ui_scale()
-                cTB.f_Label(cTB.vWidth - padding_width, notice.title, col)
-                col.alert = False
-
-                second_row = main_col.row(align=True)
-                second_row.scale_y = 1.0
-                ops = second_row.operator(
-                    "poliigon.poliigon_link",
-                    icon=notice.icon or "NONE",
-                    text=notice.ac_open_url_label,
-                )
-                if notice.tooltip:
-                    ops.vTooltip = notice.tooltip
-                ops.vMode = build_mode(
-                    notice.ac_open_url_address,
-                    notice.ac_open_url_label,
-                    notice.notification_id)
-
-        elif notice.action == Notification.ActionType.UPDATE_READY:
-            # Empirical for width for "Update ready: Download | logs".
-            single_row_width = 300
-            if panel_width > single_row_width:
-                # Single row with text + button.
-                first_row.alert = True
-                first_row.label(text=notice.title)
-                first_row.alert = False
-                splitrow = first_row.split(factor=0.7, align=True)
-                splitcol = splitrow.split(align=True)
-
-                ops = splitcol.operator(
-                    "poliigon.poliigon_link",
-                    icon=notice.icon or "NONE",
-                    text=str(notice.ac_update_ready_download_label),
-                )
-                if notice.tooltip:
-                    ops.vTooltip = notice.tooltip
-                ops.vMode = build_mode(
-                    notice.ac_update_ready_download_url,
-                    notice.ac_update_ready_download_label,
-                    notice.notification_id)
-
-                splitcol = splitrow.split(align=True)
-                ops = splitcol.operator(
-                    "poliigon.poliigon_link",
-                    text=str(notice.ac_update_ready_logs_label),
-                )
-                if notice.tooltip:
-                    ops.vTooltip = "See changes in this version"
-                ops.vMode = build_mode(
-                    notice.ac_update_ready_logs_url,
-                    notice.ac_update_ready_logs_label,
-                    notice.notification_id)
-            else:
-                # Two rows (or more, if text wrapping).
-                col = first_row.column(align=True)
-                col.alert = True
-                if notice.allow_dismiss:
-                    padding_width = 32 * cTB.get_ui_scale()
-                else:
-                    padding_width = 17 * cTB.get_ui_scale()
-                cTB.f_Label(cTB.vWidth - padding_width, notice.title, col)
-                col.alert = False
-
-                second_row = main_col.row(align=True)
-                splitrow = second_row.split(factor=0.7, align=True)
-                splitcol = splitrow.split(align=True)
-                ops = splitcol.operator(
-                    "poliigon.poliigon_link",
-                    icon=notice.icon or "NONE",
-                    text=str(notice.ac_update_ready_download_label),
-                )
-                if notice.tooltip:
-                    ops.vTooltip = notice.tooltip
-                ops.vMode = build_mode(
-                    notice.ac_update_ready_download_url,
-                    notice.ac_update_ready_download_label,
-                    notice.notification_id)
-                splitcol = splitrow.split(align=True)
-                ops = splitcol.operator(
-                    "poliigon.poliigon_link",
-                    text=str(notice.ac_update_ready_logs_label),
-                )
-                if notice.tooltip:
-                    ops.vTooltip = notice.tooltip
-                ops.vMode = build_mode(
-                    notice.ac_update_ready_logs_url,
-                    notice.ac_update_ready_logs_label,
-                    notice.notification_id)
-
-        elif notice.action == Notification.ActionType.POPUP_MESSAGE:
-            single_row_width = 250
-            if panel_width > single_row_width:
-                # Single row with text + button.
-                first_row.alert = True
-                first_row.label(text=notice.title)
-                first_row.alert = False
-                ops = first_row.operator(
-                    "poliigon.popup_message",
-                    icon=notice.icon or "NONE",
-                    text="View"
-                )
-
-            else:
-                # Two rows (or more, if text wrapping).
-                col = first_row.column(align=True)
-                col.alert = True
-                # Empirically found squaring below worked best for 1 & 2x displays,
-                # which accounts for the box+panel padding and the 'x' button.
-                if notice.allow_dismiss:
-                    padding_width = 32 * cTB.get_ui_scale()
-                else:
-                    padding_width = 17 * cTB.get_ui_scale()
-                cTB.f_Label(cTB.vWidth - padding_width, notice.title, col)
-                col.alert = False
-
-                second_row = main_col.row(align=True)
-                second_row.scale_y = 1.0
-                ops = second_row.operator(
-                    "poliigon.popup_message",
-                    icon=notice.icon or "NONE",
-                    text="View",
-                )
-
-            ops.message_body = notice.ac_popup_message_body
-            ops.notice_id = notice.notification_id
-            if notice.tooltip:
-                ops.vTooltip = notice.tooltip
-            if notice.ac_popup_message_url:
-                ops.message_url = notice.ac_popup_message_url
-
-        elif notice.action == Notification.ActionType.RUN_OPERATOR:
-            # Single row with only a button.
-            ops = first_row.operator(
-                "poliigon.notice_operator",
-                text=notice.title,
-                icon=notice.icon or "NONE",
-            )
-            ops.notice_id = notice.notification_id
-            ops.ops_name = notice.ac_run_operator_ops_name
-            ops.vTooltip = notice.tooltip
-
+        draw_func = NOTICE_DRAW_FUNCS.get(notice.action)
+        if draw_func is not None:
+            draw_func(notice, first_row, main_col, panel_width)
         else:
             main_col.label(text=notice.title)
             print("Invalid notifcation type")
@@ -16,7 +16,9 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
+from functools import lru_cache
 import os
+import tempfile
 import time
 
 
@@ -24,7 +26,9 @@ def f_Ex(vPath):
     return os.path.exists(vPath)
 
 
+@lru_cache(maxsize=4096)
 def f_FName(vPath):
+    """Returns the filename without folder and extension (cached, pure)."""
     return os.path.splitext(os.path.basename(vPath))[0]
 
 
@@ -52,6 +56,52 @@ def f_MDir(vPath):
             print("Failed to create directory: ", e)
 
 
+def write_file_atomic(vPath, content):
+    """Writes a text file via a temp file, to never leave a truncated file.
+
+    Each call uses its own temp file, so concurrent writers of the same
+    file don't interfere (last rename wins).
+    """
+    fd, temp_file = tempfile.mkstemp(
+        dir=os.path.dirname(vPath) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as vFile:
+            vFile.write(content)
+            # Make sure data is on disk before the rename makes it visible.
+            vFile.flush()
+            os.fsync(vFile.fileno())
+        try:
+            os.replace(temp_file, vPath)
+        except PermissionError:
+            # E.g. on Windows, if the file is held open by another process.
+            with open(vPath, "w") as vFile:
+                vFile.write(content)
+        else:
+            _fsync_dir(os.path.dirname(vPath))
+    finally:
+        # Only still exists, if the write or the rename failed.
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+
+
+def _fsync_dir(vPath):
+    """Persists a rename within a directory (POSIX only)."""
+    if os.name != "posix":
+        return  # Directories can not be opened for fsync on Windows.
+    try:
+        dir_fd = os.open(vPath, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
 def timer(fn):
     def wrapper(*args, **kwargs):
         start_time = time.perf_counter()